@@ -0,0 +1,49 @@
+"""Keyset pagination index
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 10:00:00
+
+"""
+
+from alembic import op
+
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add (created_at, id) index so cursor pages are a single range scan"""
+    # CONCURRENTLY keeps the table writable during the build; it cannot run
+    # inside the migration transaction
+    with op.get_context().autocommit_block():
+        # Extends idx_tasks_created_at with the id tie-breaker and supersedes it
+        op.create_index(
+            "idx_tasks_created_at_id",
+            "tasks",
+            ["created_at", "id"],
+            postgresql_ops={"created_at": "DESC", "id": "DESC"},
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_tasks_created_at", table_name="tasks", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Restore the single-column created_at index and drop the keyset index"""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_tasks_created_at",
+            "tasks",
+            ["created_at"],
+            postgresql_ops={"created_at": "DESC"},
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_tasks_created_at_id",
+            table_name="tasks",
+            postgresql_concurrently=True,
+        )
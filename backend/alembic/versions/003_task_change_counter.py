@@ -0,0 +1,70 @@
+"""Task change counter
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 11:00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "003"
+down_revision = "002"
+branch_labels = None
+depends_on = None
+
+
+# Writers bump one of these rows, picked by backend pid, so concurrent
+# writers rarely wait on each other; readers sum them
+CHANGE_COUNTER_SHARDS = 16
+
+
+def upgrade() -> None:
+    """
+    Add a sharded counter bumped once per statement that changes tasks.
+
+    A single counter row would serialize every task write in the cluster,
+    since each writer holds its row lock until commit. A sequence takes no
+    lock but advances before the writer commits, so a reader could pair the
+    new version with rows that do not show the write yet. The sum of the
+    shards only grows when a writer commits, in every snapshot.
+    """
+    op.create_table(
+        "task_changes",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.CheckConstraint(
+            f"id >= 0 AND id < {CHANGE_COUNTER_SHARDS}", name="task_changes_shard"
+        ),
+    )
+    op.execute(
+        "INSERT INTO task_changes (id, version) "
+        f"SELECT shard, 0 FROM generate_series(0, {CHANGE_COUNTER_SHARDS - 1}) shard"
+    )
+
+    op.execute(
+        f"""
+        CREATE FUNCTION bump_task_changes() RETURNS trigger AS $$
+        BEGIN
+            UPDATE task_changes SET version = version + 1
+            WHERE id = pg_backend_pid() % {CHANGE_COUNTER_SHARDS};
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_tasks_bump_changes
+        AFTER INSERT OR UPDATE OR DELETE ON tasks
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_task_changes()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop change counter trigger, function and table"""
+    op.execute("DROP TRIGGER IF EXISTS trg_tasks_bump_changes ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS bump_task_changes()")
+    op.drop_table("task_changes")
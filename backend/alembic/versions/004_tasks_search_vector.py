@@ -0,0 +1,52 @@
+"""Full-text search vector
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 12:00:00
+
+Adding the STORED generated column rewrites the whole tasks table under an
+ACCESS EXCLUSIVE lock, blocking reads and writes until it finishes (roughly
+proportional to table size). Run this revision in a maintenance window on
+large tables. The GIN index is built concurrently afterwards, so it does
+not extend the outage.
+"""
+
+from alembic import op
+
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add generated tsvector over title/description with a GIN index"""
+    op.execute(
+        """
+        ALTER TABLE tasks ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED
+        """
+    )
+    # Commits the rewrite first; CONCURRENTLY cannot run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_tasks_search_vector",
+            "tasks",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop search index and column"""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_tasks_search_vector",
+            table_name="tasks",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("tasks", "search_vector")
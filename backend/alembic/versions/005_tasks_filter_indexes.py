@@ -0,0 +1,65 @@
+"""Indexes for filtered and sorted task listing
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 13:00:00
+
+"""
+
+from alembic import op
+
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add composite indexes matching the list filters and sort keys"""
+    # CONCURRENTLY keeps tasks writable while the indexes build; it cannot
+    # run inside the migration transaction
+    with op.get_context().autocommit_block():
+        # Serves category filters in default order; supersedes idx_tasks_category
+        op.create_index(
+            "idx_tasks_category_created_at",
+            "tasks",
+            ["category", "created_at", "id"],
+            postgresql_ops={"created_at": "DESC", "id": "DESC"},
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_tasks_category", table_name="tasks", postgresql_concurrently=True
+        )
+
+        op.create_index(
+            "idx_tasks_updated_at_id",
+            "tasks",
+            ["updated_at", "id"],
+            postgresql_ops={"updated_at": "DESC", "id": "DESC"},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_tasks_estimated_time",
+            "tasks",
+            ["estimated_time"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the single-column category index and drop filter indexes"""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_tasks_estimated_time", table_name="tasks", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "idx_tasks_updated_at_id", table_name="tasks", postgresql_concurrently=True
+        )
+        op.create_index(
+            "idx_tasks_category", "tasks", ["category"], postgresql_concurrently=True
+        )
+        op.drop_index(
+            "idx_tasks_category_created_at",
+            table_name="tasks",
+            postgresql_concurrently=True,
+        )
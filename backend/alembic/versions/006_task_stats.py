@@ -0,0 +1,153 @@
+"""Incrementally maintained task statistics
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 14:00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+
+# Writers add their deltas to one of these rows per category, picked by
+# backend pid, so concurrent writes in one category rarely wait on each other;
+# readers sum the shards
+STATS_SHARDS = 16
+
+
+def upgrade() -> None:
+    """
+    Add per-category summary table kept in sync by statement triggers.
+
+    Each writer holds the row locks of its upserts until commit, so a single
+    row per category would serialize all writes within a category. Rows are
+    split into shards like task_changes. Updates only touch the table when a
+    row's category or estimated_time actually changed.
+    """
+    op.create_table(
+        "task_stats",
+        sa.Column("category", sa.String(50), primary_key=True),
+        sa.Column("shard", sa.Integer(), primary_key=True, server_default="0"),
+        sa.Column("task_count", sa.BigInteger(), nullable=False),
+        sa.Column("total_estimated_time", sa.BigInteger(), nullable=False),
+        sa.CheckConstraint(
+            f"shard >= 0 AND shard < {STATS_SHARDS}", name="task_stats_shard"
+        ),
+    )
+
+    # Transition tables let one trigger call fold a whole batch statement into
+    # a single upsert per category; rows are ordered to avoid lock cycles
+    op.execute(
+        f"""
+        CREATE FUNCTION apply_task_stats() RETURNS trigger AS $$
+        DECLARE
+            stats_shard integer := pg_backend_pid() % {STATS_SHARDS};
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO task_stats
+                    (category, shard, task_count, total_estimated_time)
+                SELECT category, stats_shard,
+                       count(*), coalesce(sum(estimated_time), 0)
+                FROM new_rows
+                GROUP BY category
+                ORDER BY category
+                ON CONFLICT (category, shard) DO UPDATE
+                SET task_count = task_stats.task_count + EXCLUDED.task_count,
+                    total_estimated_time =
+                        task_stats.total_estimated_time
+                        + EXCLUDED.total_estimated_time;
+            ELSIF TG_OP = 'DELETE' THEN
+                INSERT INTO task_stats
+                    (category, shard, task_count, total_estimated_time)
+                SELECT category, stats_shard,
+                       -count(*), -coalesce(sum(estimated_time), 0)
+                FROM old_rows
+                GROUP BY category
+                ORDER BY category
+                ON CONFLICT (category, shard) DO UPDATE
+                SET task_count = task_stats.task_count + EXCLUDED.task_count,
+                    total_estimated_time =
+                        task_stats.total_estimated_time
+                        + EXCLUDED.total_estimated_time;
+            ELSE
+                -- Title or description edits leave the statistics alone
+                WITH changed AS (
+                    SELECT o.category AS old_category,
+                           o.estimated_time AS old_estimated_time,
+                           n.category AS new_category,
+                           n.estimated_time AS new_estimated_time
+                    FROM old_rows o
+                    JOIN new_rows n ON n.id = o.id
+                    WHERE o.category IS DISTINCT FROM n.category
+                       OR o.estimated_time IS DISTINCT FROM n.estimated_time
+                ), deltas (category, task_count, estimated_time) AS (
+                    SELECT old_category, -1, -coalesce(old_estimated_time, 0)
+                    FROM changed
+                    UNION ALL
+                    SELECT new_category, 1, coalesce(new_estimated_time, 0)
+                    FROM changed
+                )
+                INSERT INTO task_stats
+                    (category, shard, task_count, total_estimated_time)
+                SELECT category, stats_shard, sum(task_count), sum(estimated_time)
+                FROM deltas
+                GROUP BY category
+                HAVING sum(task_count) <> 0 OR sum(estimated_time) <> 0
+                ORDER BY category
+                ON CONFLICT (category, shard) DO UPDATE
+                SET task_count = task_stats.task_count + EXCLUDED.task_count,
+                    total_estimated_time =
+                        task_stats.total_estimated_time
+                        + EXCLUDED.total_estimated_time;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_tasks_stats_insert
+        AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION apply_task_stats()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_tasks_stats_update
+        AFTER UPDATE ON tasks
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION apply_task_stats()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_tasks_stats_delete
+        AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION apply_task_stats()
+        """
+    )
+
+    op.execute(
+        """
+        INSERT INTO task_stats (category, task_count, total_estimated_time)
+        SELECT category, count(*), coalesce(sum(estimated_time), 0)
+        FROM tasks
+        GROUP BY category
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop statistics triggers, function and table"""
+    op.execute("DROP TRIGGER IF EXISTS trg_tasks_stats_delete ON tasks")
+    op.execute("DROP TRIGGER IF EXISTS trg_tasks_stats_update ON tasks")
+    op.execute("DROP TRIGGER IF EXISTS trg_tasks_stats_insert ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS apply_task_stats()")
+    op.drop_table("task_stats")
@@ -0,0 +1,98 @@
+"""Task change notifications
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 15:00:00
+
+"""
+
+from alembic import op
+
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+
+# Ids per NOTIFY payload: about 40 bytes each keeps a payload well under
+# Postgres's 8000-byte limit
+EVENT_IDS_PER_NOTIFY = 150
+
+
+def upgrade() -> None:
+    """
+    Publish compact NOTIFYs on task_events for every statement changing tasks.
+
+    The trigger runs once per statement and groups the changed ids into a
+    few payloads, so a 1000-row batch sends 7 notifications, not 1000. Every
+    notification reaches each worker's listener, and a transaction that
+    notifies takes a database-wide lock at commit.
+    """
+    # Payload carries ids only; subscribers fetch the tasks if they need them
+    op.execute(
+        f"""
+        CREATE FUNCTION notify_task_events() RETURNS trigger AS $$
+        DECLARE
+            event_type text := CASE TG_OP
+                WHEN 'INSERT' THEN 'created'
+                WHEN 'UPDATE' THEN 'updated'
+                ELSE 'deleted'
+            END;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify(
+                    'task_events',
+                    json_build_object('type', event_type, 'ids', json_agg(id))::text
+                )
+                FROM (
+                    SELECT id,
+                           (row_number() OVER () - 1) / {EVENT_IDS_PER_NOTIFY} AS chunk
+                    FROM old_rows
+                ) AS changed
+                GROUP BY chunk;
+            ELSE
+                PERFORM pg_notify(
+                    'task_events',
+                    json_build_object('type', event_type, 'ids', json_agg(id))::text
+                )
+                FROM (
+                    SELECT id,
+                           (row_number() OVER () - 1) / {EVENT_IDS_PER_NOTIFY} AS chunk
+                    FROM new_rows
+                ) AS changed
+                GROUP BY chunk;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_tasks_notify_insert
+        AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_task_events()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_tasks_notify_update
+        AFTER UPDATE ON tasks REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_task_events()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_tasks_notify_delete
+        AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_task_events()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop change notification triggers and function"""
+    op.execute("DROP TRIGGER IF EXISTS trg_tasks_notify_delete ON tasks")
+    op.execute("DROP TRIGGER IF EXISTS trg_tasks_notify_update ON tasks")
+    op.execute("DROP TRIGGER IF EXISTS trg_tasks_notify_insert ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS notify_task_events()")
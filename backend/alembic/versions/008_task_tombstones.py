@@ -0,0 +1,36 @@
+"""Tombstones for deleted tasks
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18 16:00:00
+
+"""
+
+from alembic import op
+
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create task_tombstones, written by deletes and read by delta sync"""
+    op.execute(
+        """
+        CREATE TABLE task_tombstones (
+            id UUID PRIMARY KEY,
+            deleted_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+        """
+    )
+    # (deleted_at, id) order is how delta sync pages through tombstones
+    op.create_index(
+        "idx_task_tombstones_deleted_at", "task_tombstones", ["deleted_at", "id"]
+    )
+
+
+def downgrade() -> None:
+    """Drop task_tombstones"""
+    op.drop_index("idx_task_tombstones_deleted_at", table_name="task_tombstones")
+    op.execute("DROP TABLE IF EXISTS task_tombstones")
@@ -0,0 +1 @@
+# Maintenance commands
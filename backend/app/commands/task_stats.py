@@ -0,0 +1,59 @@
+"""
+Check or rebuild the incrementally maintained task_stats table.
+
+    python -m backend.app.commands.task_stats --check
+    python -m backend.app.commands.task_stats --rebuild
+"""
+
+import argparse
+import asyncio
+import sys
+
+import asyncpg
+
+from backend.app.database import DatabaseConnectionPool
+from backend.app.repositories.task_repository import TaskRepository
+
+
+async def check_stats(repository: TaskRepository) -> bool:
+    """Compare task_stats with a full aggregate; print drift, return True if equal"""
+    stored = {row[0]: row[1:] for row in await repository.get_stats()}
+    actual = {row[0]: row[1:] for row in await repository.compute_stats()}
+
+    consistent = True
+    for category in sorted(stored.keys() | actual.keys()):
+        expected = actual.get(category, (0, 0))
+        found = stored.get(category, (0, 0))
+        if expected != found:
+            consistent = False
+            print(
+                f"{category}: stored count/time {found[0]}/{found[1]}, "
+                f"actual {expected[0]}/{expected[1]}"
+            )
+    return consistent
+
+
+async def main(rebuild: bool) -> int:
+    connection = await asyncpg.connect(DatabaseConnectionPool.get_dsn())
+    try:
+        repository = TaskRepository(connection)
+        if await check_stats(repository):
+            print("task_stats is consistent")
+            return 0
+        if not rebuild:
+            return 1
+
+        await repository.rebuild_stats()
+        print("task_stats rebuilt")
+        return 0
+    finally:
+        await connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check or rebuild task_stats")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true", help="report drift only")
+    mode.add_argument("--rebuild", action="store_true", help="rebuild on drift")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(rebuild=args.rebuild)))
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 
 class Settings(BaseSettings):
@@ -9,8 +10,57 @@ class Settings(BaseSettings):
     postgres_db: str
     cors_origins: str = "http://localhost:5173"
 
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    # Worker processes for backend.app.server; 0 means one per CPU
+    server_workers: int = 1
+    server_graceful_timeout: float = 30.0
+
     db_pool_min_size: int = 10
     db_pool_max_size: int = 20
+    # Connections opened before startup completes; the rest warm up later
+    db_pool_initial_size: int = 1
+    # Total connections all workers may open per database server; when set,
+    # each worker's pool gets an equal share instead of db_pool_max_size
+    db_connection_budget: Optional[int] = None
+    db_pool_acquire_timeout: float = 10.0
+    ready_probe_ttl: float = 2.0
+
+    # Comma-separated read replica URLs; reads stay on the primary when empty
+    database_replica_urls: str = ""
+    db_replica_health_interval: float = 5.0
+    # Replica checkouts give up quickly; the primary is the fallback
+    db_replica_acquire_timeout: float = 0.1
+    db_replica_read_your_writes_seconds: float = 5.0
+
+    slow_query_threshold_ms: float = 200.0
+    slow_query_explain: bool = False
+
+    tasks_page_default_limit: int = 50
+    tasks_page_max_limit: int = 200
+    tasks_stream_batch_size: int = 500
+    tasks_batch_max_size: int = 1000
+    # Negotiated list responses smaller than this are sent uncompressed
+    response_compression_min_size: int = 1024
+
+    categorization_strategy: str = "keyword"
+    categorization_keywords_file: Optional[str] = None
+    categorization_reload_interval: float = 5.0
+
+    task_cache_enabled: bool = False
+    task_cache_max_size: int = 10000
+    task_cache_ttl: float = 30.0
+
+    read_coalescing_enabled: bool = True
+    read_coalescing_timeout: float = 5.0
+
+    task_events_queue_size: int = 256
+    task_events_max_subscribers: int = 1000
+    task_events_keepalive: float = 15.0
+
+    task_changes_settle_seconds: float = 5.0
+    task_tombstone_retention_days: int = 30
+    task_tombstone_compaction_interval: float = 3600.0
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,50 @@
+import math
+import time
+
+from fastapi import Request
+
+# Cookie holding the epoch time until which a client's reads use the primary
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+_WRITE_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+
+
+def reads_from_primary(request: Request) -> bool:
+    """Whether the client wrote recently enough that replicas may lag behind"""
+    try:
+        return float(request.cookies[READ_PRIMARY_COOKIE]) > time.time()
+    except (KeyError, ValueError):
+        return False
+
+
+class ReadYourWritesMiddleware:
+    """
+    ASGI middleware pinning a client's reads to the primary after it writes.
+
+    Successful writes set a short-lived cookie; get_read_connection() sees it
+    and skips the replicas until the window has passed, so clients never
+    read data older than their own changes.
+    """
+
+    def __init__(self, app, window: float):
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in _WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = (
+                    f"{READ_PRIMARY_COOKIE}={time.time() + self.window:.3f}; "
+                    f"Max-Age={math.ceil(self.window)}; Path=/; HttpOnly; "
+                    "SameSite=Lax"
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"set-cookie", cookie.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
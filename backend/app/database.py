@@ -1,13 +1,81 @@
+import asyncio
+import logging
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
 import asyncpg
-from typing import Optional
+from fastapi import Request
+
 from backend.app.config import get_settings
+from backend.app.consistency import reads_from_primary
+from backend.app.metrics import REGISTRY, Counter, Gauge, Histogram
+from backend.app.repositories.task_repository import prepare_statements
+
+logger = logging.getLogger(__name__)
+
+# Failures that mean a replica is unreachable rather than merely busy
+_CONNECTION_ERRORS = (
+    OSError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.CannotConnectNowError,
+    asyncpg.InterfaceError,
+)
+
+# Backoff between attempts to reopen a dropped LISTEN connection, in seconds
+_LISTENER_RETRY_INITIAL = 0.5
+_LISTENER_RETRY_MAX = 30.0
+
+POOL_ACQUIRE_SECONDS = REGISTRY.register(
+    Histogram(
+        "db_pool_acquire_wait_seconds",
+        "Time spent waiting for a pool connection",
+    )
+)
+POOL_ACQUIRE_TIMEOUTS = REGISTRY.register(
+    Counter(
+        "db_pool_acquire_timeouts_total",
+        "Pool acquisitions that gave up after db_pool_acquire_timeout",
+    )
+)
+POOL_CONNECTIONS_OPENED = REGISTRY.register(
+    Counter("db_pool_connections_opened_total", "Pool connections opened")
+)
+POOL_CONNECTIONS_CLOSED = REGISTRY.register(
+    Counter("db_pool_connections_closed_total", "Pool connections closed")
+)
+
+
+class Replica:
+    """A read replica's pool and whether the last health check passed"""
+
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+        self.pool: Optional[asyncpg.Pool] = None
+        self.healthy = False
 
 
 class DatabaseConnectionPool:
-    """Singleton pattern: manages a single database connection pool instance"""
+    """
+    Singleton pattern: manages the primary connection pool and, when
+    DATABASE_REPLICA_URLS is set, one pool per read replica.
+    """
 
     _instance: Optional["DatabaseConnectionPool"] = None
     _pool: Optional[asyncpg.Pool] = None
+    _listener: Optional[asyncpg.Connection] = None
+    # channel -> [(notification callback, reconnect callback or None)]
+    _channels: Dict[str, List[Tuple[Callable, Optional[Callable]]]] = {}
+    _reconnect_task: Optional[asyncio.Task] = None
+    _replicas: Tuple[Replica, ...] = ()
+    _replica_index = 0
+    _health_task: Optional[asyncio.Task] = None
+    _warmup_task: Optional[asyncio.Task] = None
+    _warm = False
+    _liveness: Tuple[float, bool] = (float("-inf"), False)
+    _probe: Optional[asyncio.Future] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -15,25 +83,221 @@ class DatabaseConnectionPool:
         return cls._instance
 
     async def initialize(self):
-        """Initialize connection pool with configured min/max connections"""
+        """
+        Open the primary pool with db_pool_initial_size connections.
+
+        The rest of the pool is warmed up in the background, and replicas
+        are connected by their first health check. Startup therefore waits
+        for a single round trip instead of a full pool.
+        """
         if self._pool is None:
             settings = get_settings()
-            # Extract connection parameters from URL
-            url = settings.database_url.replace(
-                "postgresql+asyncpg://", "postgresql://"
-            )
-            self._pool = await asyncpg.create_pool(
-                url,
-                min_size=settings.db_pool_min_size,
-                max_size=settings.db_pool_max_size,
-            )
+            min_size, _ = pool_size_limits()
+            initial_size = min(settings.db_pool_initial_size, min_size)
+            self._pool = await self._create_pool(self.get_dsn(), initial_size)
+            self._warm = initial_size >= min_size
+            if not self._warm:
+                self._warmup_task = asyncio.create_task(
+                    self._warm_up(self._pool, min_size)
+                )
+            self._replicas = tuple(map(Replica, self.get_replica_dsns()))
+            if self._replicas:
+                self._health_task = asyncio.create_task(
+                    self._check_replicas_periodically(
+                        settings.db_replica_health_interval
+                    )
+                )
 
     async def close(self):
-        """Close connection pool on application shutdown"""
+        """Close connection pools on application shutdown"""
+        for task in (self._warmup_task, self._health_task, self._reconnect_task):
+            if task:
+                task.cancel()
+        self._warmup_task = self._health_task = self._reconnect_task = None
+        self._channels = {}
+        if self._listener:
+            listener, self._listener = self._listener, None
+            await listener.close()
+        for replica in self._replicas:
+            if replica.pool:
+                await replica.pool.close()
+        self._replicas = ()
         if self._pool:
             await self._pool.close()
             self._pool = None
 
+    async def _create_pool(
+        self, dsn: str, min_size: Optional[int] = None
+    ) -> asyncpg.Pool:
+        default_min_size, max_size = pool_size_limits()
+        return await asyncpg.create_pool(
+            dsn,
+            min_size=default_min_size if min_size is None else min_size,
+            max_size=max_size,
+            init=self._init_connection,
+        )
+
+    async def _warm_up(self, pool: asyncpg.Pool, size: int) -> None:
+        """Open (and prepare) `size` connections in parallel, releasing each"""
+
+        async def open_one() -> None:
+            connection = await pool.acquire()
+            await pool.release(connection)
+
+        # Every acquire claims a pool slot before the first connect finishes,
+        # so `size` connections are opened even though each is released as
+        # soon as it is ready for requests
+        results = await asyncio.gather(
+            *(open_one() for _ in range(size)), return_exceptions=True
+        )
+        failed = sum(isinstance(result, BaseException) for result in results)
+        if failed:
+            logger.warning("Pool warm-up could not open %d connections", failed)
+        self._warm = True
+
+    def pool_state(self) -> Optional[Dict[str, Any]]:
+        """Primary pool sizes and warm-up status, None before initialize()"""
+        if self._pool is None:
+            return None
+        return {
+            "size": self._pool.get_size(),
+            "idle": self._pool.get_idle_size(),
+            "max_size": self._pool.get_max_size(),
+            "warm": self._warm,
+            "replicas_healthy": sum(replica.healthy for replica in self._replicas),
+            "replicas": len(self._replicas),
+        }
+
+    async def is_alive(self, ttl: float) -> bool:
+        """
+        Whether the primary answered SELECT 1, cached for `ttl` seconds.
+
+        Concurrent callers share one in-flight probe, so frequent readiness
+        checks cost at most one query per `ttl`.
+        """
+        checked_at, alive = self._liveness
+        if time.monotonic() - checked_at < ttl:
+            return alive
+        if self._probe is None:
+            self._probe = asyncio.ensure_future(self._ping())
+        try:
+            return await asyncio.shield(self._probe)
+        finally:
+            self._probe = None
+
+    async def _ping(self) -> bool:
+        try:
+            async with self.get_pool().acquire(timeout=1) as connection:
+                alive = await connection.fetchval("SELECT 1") == 1
+        except Exception:
+            alive = False
+        self._liveness = (time.monotonic(), alive)
+        return alive
+
+    @staticmethod
+    async def _init_connection(connection: asyncpg.Connection) -> None:
+        """Per-connection setup: count churn and prepare hot statements"""
+        POOL_CONNECTIONS_OPENED.inc()
+        connection.add_termination_listener(
+            lambda _connection: POOL_CONNECTIONS_CLOSED.inc()
+        )
+        await prepare_statements(connection)
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self._replicas)
+
+    async def check_replicas(self) -> None:
+        """Mark each replica healthy if it answers a trivial query"""
+        for replica in self._replicas:
+            try:
+                if replica.pool is None:
+                    replica.pool = await self._create_pool(replica.dsn)
+                async with replica.pool.acquire(timeout=2) as connection:
+                    await connection.fetchval("SELECT 1")
+                healthy = True
+            except Exception:
+                healthy = False
+            if healthy != replica.healthy:
+                logger.warning(
+                    "Read replica %s is %s",
+                    replica.dsn.rsplit("@", 1)[-1],
+                    "healthy" if healthy else "unhealthy",
+                )
+            replica.healthy = healthy
+
+    async def _check_replicas_periodically(self, interval: float) -> None:
+        while True:
+            await self.check_replicas()
+            await asyncio.sleep(interval)
+
+    def _next_replica(self) -> Optional[Replica]:
+        """Round-robin over healthy replicas; None if there are none"""
+        count = len(self._replicas)
+        for offset in range(count):
+            replica = self._replicas[(self._replica_index + offset) % count]
+            if replica.healthy and replica.pool is not None:
+                DatabaseConnectionPool._replica_index = (
+                    self._replica_index + offset + 1
+                ) % count
+                return replica
+        return None
+
+    @staticmethod
+    async def _checkout(pool: asyncpg.Pool, timeout: float):
+        """Enter pool.acquire(), recording wait time and timeouts"""
+        context = pool.acquire(timeout=timeout)
+        started = time.perf_counter()
+        try:
+            connection = await context.__aenter__()
+        except asyncio.TimeoutError:
+            POOL_ACQUIRE_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_ACQUIRE_SECONDS.observe(time.perf_counter() - started)
+        return context, connection
+
+    @asynccontextmanager
+    async def acquire(
+        self, readonly: bool = False
+    ) -> AsyncIterator[asyncpg.Connection]:
+        """
+        Check out a connection, from a read replica when `readonly` is set.
+
+        Replicas are used round-robin while healthy; an unreachable or
+        exhausted replica falls back to the primary. A full replica pool is
+        skipped and a replica checkout waits only db_replica_acquire_timeout,
+        so the fallback costs little. The primary waits at most
+        db_pool_acquire_timeout seconds so an exhausted pool fails visibly
+        instead of queueing requests indefinitely.
+        """
+        settings = get_settings()
+        checkout = None
+        replica = self._next_replica() if readonly else None
+        if replica is not None and not _exhausted(replica.pool):
+            try:
+                checkout = await self._checkout(
+                    replica.pool, settings.db_replica_acquire_timeout
+                )
+            except asyncio.TimeoutError:
+                pass
+            except _CONNECTION_ERRORS:
+                logger.warning("Read replica unreachable, using primary")
+                replica.healthy = False
+        if checkout is None:
+            checkout = await self._checkout(
+                self.get_pool(), settings.db_pool_acquire_timeout
+            )
+
+        context, connection = checkout
+        try:
+            yield connection
+        except BaseException:
+            await context.__aexit__(*sys.exc_info())
+            raise
+        else:
+            await context.__aexit__(None, None, None)
+
     def get_pool(self) -> asyncpg.Pool:
         if self._pool is None:
             raise RuntimeError(
@@ -41,10 +305,181 @@ class DatabaseConnectionPool:
             )
         return self._pool
 
+    async def add_listener(
+        self,
+        channel: str,
+        callback: Callable,
+        on_reconnect: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Subscribe to a Postgres NOTIFY channel.
+
+        LISTEN needs a connection that stays checked out, so all channels
+        share one dedicated connection opened outside the request pool. If
+        that connection drops it is reopened with backoff and every channel
+        is listened to again; notifications sent in between are lost, so
+        `on_reconnect` is called once the channel is back.
+        """
+        self._channels = {**self._channels}
+        self._channels.setdefault(channel, []).append((callback, on_reconnect))
+        if self._reconnect_task is not None:
+            return  # the reconnect listens to every registered channel
+        if self._listener is None:
+            self._listener = await self._connect_listener()
+        else:
+            await self._listener.add_listener(channel, callback)
+
+    async def _connect_listener(self) -> asyncpg.Connection:
+        """Open a LISTEN connection subscribed to every registered channel"""
+        connection = await asyncpg.connect(self.get_dsn())
+        listened = set()
+        try:
+            # Loop until stable: channels may be registered while awaiting
+            while True:
+                pending = [
+                    (channel, callback)
+                    for channel, registrations in self._channels.items()
+                    for callback, _ in registrations
+                    if (channel, callback) not in listened
+                ]
+                if not pending:
+                    break
+                for channel, callback in pending:
+                    await connection.add_listener(channel, callback)
+                    listened.add((channel, callback))
+        except BaseException:
+            await connection.close()
+            raise
+        connection.add_termination_listener(self._on_listener_terminated)
+        return connection
+
+    def _on_listener_terminated(self, connection: asyncpg.Connection) -> None:
+        if connection is not self._listener:
+            return  # closed on purpose, or already replaced
+        logger.warning("LISTEN connection lost, reconnecting")
+        self._listener = None
+        self._reconnect_task = asyncio.create_task(self._reconnect_listener())
+
+    async def _reconnect_listener(self) -> None:
+        """Reopen the LISTEN connection with exponential backoff"""
+        delay = _LISTENER_RETRY_INITIAL
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                self._listener = await self._connect_listener()
+                break
+            except (*_CONNECTION_ERRORS, asyncpg.PostgresError) as e:
+                logger.warning("LISTEN reconnect failed, retrying: %s", e)
+                delay = min(delay * 2, _LISTENER_RETRY_MAX)
+        self._reconnect_task = None
+        logger.info("LISTEN connection restored")
+        for registrations in list(self._channels.values()):
+            for _, on_reconnect in registrations:
+                if on_reconnect is not None:
+                    on_reconnect()
+
+    @staticmethod
+    def get_dsn() -> str:
+        """asyncpg DSN derived from the SQLAlchemy-style DATABASE_URL"""
+        return _to_asyncpg_dsn(get_settings().database_url)
+
+    @staticmethod
+    def get_replica_dsns() -> List[str]:
+        """asyncpg DSNs of the comma-separated DATABASE_REPLICA_URLS"""
+        urls = get_settings().database_replica_urls
+        return [_to_asyncpg_dsn(url.strip()) for url in urls.split(",") if url.strip()]
+
+
+def _to_asyncpg_dsn(url: str) -> str:
+    return url.replace("postgresql+asyncpg://", "postgresql://")
+
+
+def worker_count() -> int:
+    """Worker processes sharing the database, per SERVER_WORKERS"""
+    workers = get_settings().server_workers
+    return workers if workers > 0 else os.cpu_count() or 1
+
+
+def pool_size_limits() -> Tuple[int, int]:
+    """
+    (min_size, max_size) for each of this worker's pools.
+
+    With db_connection_budget set, the budget is divided evenly across the
+    workers, keeping one connection per worker for the LISTEN connection.
+    """
+    settings = get_settings()
+    max_size = settings.db_pool_max_size
+    if settings.db_connection_budget is not None:
+        max_size = settings.db_connection_budget // worker_count() - 1
+        if max_size < 1:
+            raise ValueError(
+                f"DB_CONNECTION_BUDGET={settings.db_connection_budget} is too "
+                f"small for {worker_count()} workers"
+            )
+    return min(settings.db_pool_min_size, max_size), max_size
+
 
 async def get_db_connection():
     """Dependency injection: provides database connection to FastAPI routes"""
     db_pool = DatabaseConnectionPool()
-    pool = db_pool.get_pool()
-    async with pool.acquire() as connection:
+    async with db_pool.acquire() as connection:
         yield connection
+
+
+async def get_read_connection(request: Request):
+    """
+    Dependency injection: connection for read-only routes.
+
+    Served by a replica unless the client wrote recently, in which case the
+    primary is used so it reads its own writes.
+    """
+    db_pool = DatabaseConnectionPool()
+    async with db_pool.acquire(readonly=not reads_from_primary(request)) as connection:
+        yield connection
+
+
+def _exhausted(pool: asyncpg.Pool) -> bool:
+    """True if every connection the pool may open is checked out"""
+    return pool.get_idle_size() == 0 and pool.get_size() >= pool.get_max_size()
+
+
+def _pool_gauge(read: Callable[[asyncpg.Pool], int]) -> Callable[[], float]:
+    """Gauge callback reading the live pool, or 0 before initialization"""
+
+    def collect() -> float:
+        pool = DatabaseConnectionPool()._pool
+        return read(pool) if pool is not None else 0
+
+    return collect
+
+
+REGISTRY.register(
+    Gauge(
+        "db_pool_connections_in_use",
+        "Pool connections currently checked out",
+        _pool_gauge(lambda pool: pool.get_size() - pool.get_idle_size()),
+    )
+)
+REGISTRY.register(
+    Gauge(
+        "db_pool_connections_idle",
+        "Open pool connections waiting to be acquired",
+        _pool_gauge(lambda pool: pool.get_idle_size()),
+    )
+)
+REGISTRY.register(
+    Gauge(
+        "db_pool_connections_max",
+        "Configured maximum pool size",
+        _pool_gauge(lambda pool: pool.get_max_size()),
+    )
+)
+REGISTRY.register(
+    Gauge(
+        "db_replicas_healthy",
+        "Read replicas that passed their last health check",
+        lambda: sum(
+            replica.healthy for replica in DatabaseConnectionPool()._replicas
+        ),
+    )
+)
@@ -0,0 +1,34 @@
+import hashlib
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Response, status
+
+
+def task_etag(task_id: UUID, updated_at: datetime) -> str:
+    """Strong ETag for a single task: changes whenever the row is updated"""
+    return f'"{task_id}-{updated_at.timestamp():.6f}"'
+
+
+def list_etag(version: int, *parts: Optional[object]) -> str:
+    """Strong ETag for a list response at a given change-counter version"""
+    key = "|".join(str(part) for part in (version, *parts))
+    return f'"{hashlib.blake2b(key.encode(), digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against an ETag (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
@@ -1,19 +1,66 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from datetime import timedelta
+import asyncio
+import logging
 
 from backend.app.config import get_settings
+from backend.app.consistency import ReadYourWritesMiddleware
 from backend.app.database import DatabaseConnectionPool
+from backend.app.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    REGISTRY,
+    RequestMetricsMiddleware,
+)
+from backend.app.repositories.task_repository import TaskRepository
 from backend.app.routes import tasks_router
-import uvicorn
+from backend.app.services.cache import (
+    invalidations_shared,
+    on_invalidation_reconnect,
+    on_task_event_notify,
+)
+from backend.app.services.events import TASK_EVENTS_CHANNEL
+from backend.app.services.task_service import TaskService
+
+logger = logging.getLogger(__name__)
+
+
+async def compact_tombstones_periodically(interval: float, retention: timedelta):
+    """Drop expired delete tombstones every `interval` seconds"""
+    while True:
+        try:
+            async with DatabaseConnectionPool().acquire() as connection:
+                service = TaskService(TaskRepository(connection))
+                removed = await service.compact_tombstones(retention)
+            if removed:
+                logger.info("Compacted %d task tombstones", removed)
+        except Exception:
+            logger.exception("Task tombstone compaction failed")
+        await asyncio.sleep(interval)
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
-    """Manage database connection pool lifecycle"""
+    """Manage database connection pool and background task lifecycle"""
+    settings = get_settings()
     db_pool = DatabaseConnectionPool()
     await db_pool.initialize()
+    if invalidations_shared():
+        await db_pool.add_listener(
+            TASK_EVENTS_CHANNEL,
+            on_task_event_notify,
+            on_reconnect=on_invalidation_reconnect,
+        )
+    compaction = asyncio.create_task(
+        compact_tombstones_periodically(
+            settings.task_tombstone_compaction_interval,
+            timedelta(days=settings.task_tombstone_retention_days),
+        )
+    )
     yield
+    compaction.cancel()
     await db_pool.close()
 
 
@@ -35,6 +82,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Reads go to replicas when configured, except right after a client's writes
+if DatabaseConnectionPool.get_replica_dsns():
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        window=settings.db_replica_read_your_writes_seconds,
+    )
+
+# Per-route latency histograms, served by /metrics
+app.add_middleware(RequestMetricsMiddleware)
+
 # Routes
 app.include_router(tasks_router)
 
@@ -45,5 +102,31 @@ async def health_check():
     return {"status": "healthy", "service": "todo-api", "version": "1.0.0"}
 
 
+@app.get("/api/ready")
+async def readiness_check():
+    """
+    Readiness probe: 503 until the pool is open and the database answers.
+
+    Unlike /api/health this reflects the database; the liveness query is
+    cached for READY_PROBE_TTL seconds.
+    """
+    db_pool = DatabaseConnectionPool()
+    pool = db_pool.pool_state()
+    ready = pool is not None and await db_pool.is_alive(settings.ready_probe_ttl)
+    return JSONResponse(
+        {"status": "ready" if ready else "unavailable", "pool": pool},
+        status_code=200 if ready else 503,
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus text exposition of pool and request metrics for this worker"""
+    return Response(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Imported here so workers do not load the server entry point
+    from backend.app.server import main
+
+    main()
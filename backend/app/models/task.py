@@ -4,7 +4,22 @@ from typing import Optional
 
 
 class Task:
-    """Domain model representing a task entity"""
+    """
+    Domain model representing a task entity.
+
+    Uses __slots__ instead of a per-instance __dict__ since list endpoints
+    hold thousands of these at once.
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "category",
+        "estimated_time",
+        "created_at",
+        "updated_at",
+    )
 
     def __init__(
         self,
@@ -1,7 +1,239 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 import asyncpg
 from backend.app.models.task import Task
+from backend.app.tracing import TimedConnection
+
+
+class Unset:
+    """Marker type for update arguments that were not provided"""
+
+    def __repr__(self) -> str:
+        return "UNSET"
+
+
+# Typed as Any so it can default Optional[...] parameters
+UNSET: Any = Unset()
+
+_TASK_COLUMNS = """id, title, description, category, estimated_time,
+                   created_at, updated_at"""
+
+# Every query is a fixed string so asyncpg's per-connection statement cache
+# holds exactly one prepared statement for each, whatever the arguments.
+STATEMENTS: Dict[str, str] = {
+    "create": f"""
+        INSERT INTO tasks (title, description, category, estimated_time)
+        VALUES ($1, $2, $3, $4)
+        RETURNING {_TASK_COLUMNS}
+    """,
+    "create_many": f"""
+        INSERT INTO tasks (title, description, category, estimated_time)
+        SELECT * FROM unnest($1::text[], $2::text[], $3::text[], $4::int[])
+        RETURNING {_TASK_COLUMNS}
+    """,
+    "get_by_id": f"""
+        SELECT {_TASK_COLUMNS}
+        FROM tasks
+        WHERE id = $1
+    """,
+    "get_updated_at": "SELECT updated_at FROM tasks WHERE id = $1",
+    "get_change_version": "SELECT sum(version)::bigint FROM task_changes",
+    "get_all": f"""
+        SELECT {_TASK_COLUMNS}
+        FROM tasks
+        ORDER BY created_at DESC
+    """,
+    "iter_all": f"""
+        SELECT {_TASK_COLUMNS}
+        FROM tasks
+        ORDER BY created_at DESC, id DESC
+    """,
+    "get_first_page": f"""
+        SELECT {_TASK_COLUMNS}
+        FROM tasks
+        ORDER BY created_at DESC, id DESC
+        LIMIT $1
+    """,
+    "get_page_after": f"""
+        SELECT {_TASK_COLUMNS}
+        FROM tasks
+        WHERE (created_at, id) < ($1, $2)
+        ORDER BY created_at DESC, id DESC
+        LIMIT $3
+    """,
+    # Nullable columns take an explicit "set" flag so they can be cleared;
+    # NULL for title/category means "leave unchanged"
+    "update": f"""
+        UPDATE tasks
+        SET title = COALESCE($2, title),
+            description = CASE WHEN $3 THEN $4 ELSE description END,
+            category = COALESCE($5, category),
+            estimated_time = CASE WHEN $6 THEN $7 ELSE estimated_time END,
+            updated_at = NOW()
+        WHERE id = $1
+        RETURNING {_TASK_COLUMNS}
+    """,
+    # Deletes leave a tombstone so delta sync can report them
+    "delete": """
+        WITH deleted AS (DELETE FROM tasks WHERE id = $1 RETURNING id)
+        INSERT INTO task_tombstones (id)
+        SELECT id FROM deleted
+        ON CONFLICT (id) DO UPDATE SET deleted_at = NOW()
+        RETURNING id
+    """,
+    # Ranked full-text search served by the GIN index on search_vector
+    "search_first_page": f"""
+        SELECT {_TASK_COLUMNS}, ts_rank(search_vector, query) AS rank
+        FROM tasks, websearch_to_tsquery('english', $1) AS query
+        WHERE search_vector @@ query
+        ORDER BY rank DESC, id DESC
+        LIMIT $2
+    """,
+    "search_page_after": f"""
+        SELECT {_TASK_COLUMNS}, ts_rank(search_vector, query) AS rank
+        FROM tasks, websearch_to_tsquery('english', $1) AS query
+        WHERE search_vector @@ query
+          AND (ts_rank(search_vector, query), id) < ($2::real, $3)
+        ORDER BY rank DESC, id DESC
+        LIMIT $4
+    """,
+    "update_many": """
+        UPDATE tasks AS t
+        SET title = COALESCE(u.title, t.title),
+            description = CASE
+                WHEN u.set_description THEN u.description ELSE t.description
+            END,
+            category = COALESCE(u.category, t.category),
+            estimated_time = CASE
+                WHEN u.set_estimated_time THEN u.estimated_time
+                ELSE t.estimated_time
+            END,
+            updated_at = NOW()
+        FROM unnest(
+            $1::uuid[], $2::text[], $3::bool[], $4::text[],
+            $5::text[], $6::bool[], $7::int[]
+        ) AS u(id, title, set_description, description,
+               category, set_estimated_time, estimated_time)
+        WHERE t.id = u.id
+        RETURNING t.id, t.title, t.description, t.category,
+                  t.estimated_time, t.created_at, t.updated_at
+    """,
+    "delete_many": """
+        WITH deleted AS (
+            DELETE FROM tasks WHERE id = ANY($1::uuid[]) RETURNING id
+        )
+        INSERT INTO task_tombstones (id)
+        SELECT id FROM deleted
+        ON CONFLICT (id) DO UPDATE SET deleted_at = NOW()
+        RETURNING id
+    """,
+    "get_tombstones": """
+        SELECT id, deleted_at
+        FROM task_tombstones
+        WHERE (deleted_at, id) > ($1, $2)
+        ORDER BY deleted_at, id
+        LIMIT $3
+    """,
+    "compact_tombstones": "DELETE FROM task_tombstones WHERE deleted_at < $1",
+    # task_stats is maintained by triggers in per-writer shards; these read
+    # (summing the shards), audit and rebuild it
+    "get_stats": """
+        SELECT category, sum(task_count)::bigint AS task_count,
+               sum(total_estimated_time)::bigint AS total_estimated_time
+        FROM task_stats
+        GROUP BY category
+        HAVING sum(task_count) > 0
+        ORDER BY category
+    """,
+    "compute_stats": """
+        SELECT category, count(*) AS task_count,
+               coalesce(sum(estimated_time), 0) AS total_estimated_time
+        FROM tasks
+        GROUP BY category
+        ORDER BY category
+    """,
+    "rebuild_stats": """
+        INSERT INTO task_stats (category, shard, task_count, total_estimated_time)
+        SELECT category, 0, count(*), coalesce(sum(estimated_time), 0)
+        FROM tasks
+        GROUP BY category
+    """,
+}
+
+# Sortable columns for filtered listing; both are NOT NULL so keyset
+# comparisons on (column, id) are well defined
+SORT_COLUMNS = ("created_at", "updated_at")
+DEFAULT_SORT = "-created_at"
+
+# Filter name -> SQL predicate, applied in this fixed order so each
+# combination of filters always produces the same statement text
+_FILTER_CLAUSES = (
+    ("category", "category = {}"),
+    ("min_estimated_time", "estimated_time >= {}"),
+    ("max_estimated_time", "estimated_time <= {}"),
+    ("created_after", "created_at >= {}"),
+    ("created_before", "created_at < {}"),
+    ("updated_after", "updated_at >= {}"),
+    ("updated_before", "updated_at < {}"),
+)
+
+
+def build_page_query(
+    limit: int,
+    after: Optional[Tuple[datetime, UUID]],
+    filters: Dict[str, Any],
+    sort: str,
+) -> Tuple[str, List[Any]]:
+    """
+    Build a parameterized, index-friendly page query.
+
+    Values are always bound as parameters; only the clause shape varies, so
+    asyncpg caches one statement per distinct filter/sort combination.
+    """
+    conditions: List[str] = []
+    args: List[Any] = []
+    for name, clause in _FILTER_CLAUSES:
+        if filters.get(name) is not None:
+            args.append(filters[name])
+            conditions.append(clause.format(f"${len(args)}"))
+
+    column = sort.lstrip("-")
+    descending = sort.startswith("-")
+    if after is not None:
+        args.extend(after)
+        comparison = "<" if descending else ">"
+        conditions.append(
+            f"({column}, id) {comparison} (${len(args) - 1}, ${len(args)})"
+        )
+
+    direction = "DESC" if descending else "ASC"
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    args.append(limit)
+    query = f"""
+        SELECT {_TASK_COLUMNS}
+        FROM tasks
+        {where}
+        ORDER BY {column} {direction}, id {direction}
+        LIMIT ${len(args)}
+    """
+    return query, args
+
+
+# SQL text -> statement name, for timing and the slow-query log
+_STATEMENT_NAMES = {sql: name for name, sql in STATEMENTS.items()}
+
+# Statements worth preparing on every new pool connection
+PREPARED_STATEMENTS = (
+    "create",
+    "get_by_id",
+    "get_updated_at",
+    "get_change_version",
+    "get_first_page",
+    "get_page_after",
+    "update",
+    "delete",
+)
 
 
 class TaskRepository:
@@ -9,10 +241,11 @@ class TaskRepository:
     Repository pattern: abstracts database operations for Task entities.
 
     Provides clean interface for data access, hiding SQL implementation details.
+    Every statement is timed by name through TimedConnection.
     """
 
     def __init__(self, connection: asyncpg.Connection):
-        self.connection = connection
+        self.connection = TimedConnection(connection, _STATEMENT_NAMES)
 
     async def create(
         self,
@@ -23,110 +256,251 @@ class TaskRepository:
     ) -> Task:
         """Create new task with auto-generated UUID and timestamps"""
         row = await self.connection.fetchrow(
-            """
-            INSERT INTO tasks (title, description, category, estimated_time)
-            VALUES ($1, $2, $3, $4)
-            RETURNING id, title, description, category, estimated_time,
-                      created_at, updated_at
-            """,
-            title,
-            description,
-            category,
-            estimated_time,
+            STATEMENTS["create"], title, description, category, estimated_time
         )
         return self._row_to_task(row)
 
+    async def create_many(
+        self,
+        tasks: Sequence[Tuple[str, Optional[str], str, Optional[int]]],
+    ) -> List[Task]:
+        """
+        Create many tasks in a single round trip.
+
+        Each item is a (title, description, category, estimated_time) tuple;
+        columns are sent as arrays and expanded server-side with unnest().
+        """
+        if not tasks:
+            return []
+
+        titles, descriptions, categories, estimated_times = zip(*tasks)
+        rows = await self.connection.fetch(
+            STATEMENTS["create_many"],
+            list(titles),
+            list(descriptions),
+            list(categories),
+            list(estimated_times),
+        )
+        return list(map(self._row_to_task, rows))
+
     async def get_by_id(self, task_id: UUID) -> Optional[Task]:
         """Retrieve task by UUID"""
-        row = await self.connection.fetchrow(
-            """
-            SELECT id, title, description, category, estimated_time,
-                   created_at, updated_at
-            FROM tasks
-            WHERE id = $1
-            """,
-            task_id,
-        )
+        row = await self.connection.fetchrow(STATEMENTS["get_by_id"], task_id)
         return self._row_to_task(row) if row else None
 
+    async def get_updated_at(self, task_id: UUID) -> Optional[datetime]:
+        """Retrieve only the last-modified timestamp of a task"""
+        return await self.connection.fetchval(STATEMENTS["get_updated_at"], task_id)
+
+    async def get_change_version(self) -> int:
+        """Retrieve the counter bumped by every statement that modifies tasks"""
+        return await self.connection.fetchval(STATEMENTS["get_change_version"])
+
+    def snapshot(self):
+        """Read-only REPEATABLE READ transaction: all reads see one snapshot"""
+        return self.connection.transaction(isolation="repeatable_read", readonly=True)
+
     async def get_all(self) -> List[Task]:
         """Retrieve all tasks ordered by creation date"""
-        rows = await self.connection.fetch(
-            """
-            SELECT id, title, description, category, estimated_time,
-                   created_at, updated_at
-            FROM tasks
-            ORDER BY created_at DESC
-            """
-        )
-        return [self._row_to_task(row) for row in rows]
+        rows = await self.connection.fetch(STATEMENTS["get_all"])
+        return list(map(self._row_to_task, rows))
+
+    async def iter_all(self, prefetch: int = 500) -> AsyncIterator[Task]:
+        """
+        Stream all tasks through a server-side cursor.
+
+        Rows are pulled from Postgres `prefetch` at a time inside a single
+        transaction, so memory use stays flat regardless of table size.
+        """
+        async with self.connection.transaction():
+            cursor = self.connection.cursor(STATEMENTS["iter_all"], prefetch=prefetch)
+            async for row in cursor:
+                yield self._row_to_task(row)
+
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        sort: str = DEFAULT_SORT,
+        **filters: Any,
+    ) -> List[Task]:
+        """
+        Retrieve one page of tasks using keyset pagination.
+
+        Rows are ordered by (sort column, id) so the scan is served by a
+        composite index and `after` resumes strictly past the last row of
+        the previous page. Unfiltered default-order pages use the prepared
+        statements; anything else goes through build_page_query().
+        """
+        if sort != DEFAULT_SORT or any(v is not None for v in filters.values()):
+            query, args = build_page_query(limit, after, filters, sort)
+            rows = await self.connection.fetch(query, *args)
+        elif after is None:
+            rows = await self.connection.fetch(STATEMENTS["get_first_page"], limit)
+        else:
+            rows = await self.connection.fetch(
+                STATEMENTS["get_page_after"], after[0], after[1], limit
+            )
+        return list(map(self._row_to_task, rows))
+
+    async def search(
+        self, query: str, limit: int, after: Optional[Tuple[float, UUID]] = None
+    ) -> List[Tuple[Task, float]]:
+        """
+        Full-text search over title and description, best matches first.
+
+        Returns (task, rank) pairs; `after` is the (rank, id) of the last
+        result of the previous page.
+        """
+        if after is None:
+            rows = await self.connection.fetch(
+                STATEMENTS["search_first_page"], query, limit
+            )
+        else:
+            rows = await self.connection.fetch(
+                STATEMENTS["search_page_after"], query, after[0], after[1], limit
+            )
+        # Ranked rows carry the rank after the task columns
+        return [(Task(*row[:-1]), row[-1]) for row in rows]
 
     async def update(
         self,
         task_id: UUID,
         title: Optional[str] = None,
-        description: Optional[str] = None,
+        description: Optional[str] = UNSET,
         category: Optional[str] = None,
-        estimated_time: Optional[int] = None,
+        estimated_time: Optional[int] = UNSET,
     ) -> Optional[Task]:
-        """Update task fields and refresh updated_at timestamp"""
-        # Build dynamic update query for provided fields
-        updates = []
-        values = []
-        param_count = 1
-
-        if title is not None:
-            updates.append(f"title = ${param_count}")
-            values.append(title)
-            param_count += 1
-
-        if description is not None:
-            updates.append(f"description = ${param_count}")
-            values.append(description)
-            param_count += 1
-
-        if category is not None:
-            updates.append(f"category = ${param_count}")
-            values.append(category)
-            param_count += 1
-
-        if estimated_time is not None:
-            updates.append(f"estimated_time = ${param_count}")
-            values.append(estimated_time)
-            param_count += 1
-
-        if not updates:
-            return await self.get_by_id(task_id)
-
-        updates.append("updated_at = NOW()")
-        values.append(task_id)
+        """
+        Update task fields and refresh updated_at timestamp.
 
-        query = f"""
-            UPDATE tasks
-            SET {", ".join(updates)}
-            WHERE id = ${param_count}
-            RETURNING id, title, description, category, estimated_time,
-                      created_at, updated_at
+        None leaves title/category unchanged; description and estimated_time
+        are left unchanged only when UNSET, so passing None clears them.
         """
+        set_description = description is not UNSET
+        set_estimated_time = estimated_time is not UNSET
+        if (
+            title is None
+            and category is None
+            and not set_description
+            and not set_estimated_time
+        ):
+            return await self.get_by_id(task_id)
 
-        row = await self.connection.fetchrow(query, *values)
+        row = await self.connection.fetchrow(
+            STATEMENTS["update"],
+            task_id,
+            title,
+            set_description,
+            description if set_description else None,
+            category,
+            set_estimated_time,
+            estimated_time if set_estimated_time else None,
+        )
         return self._row_to_task(row) if row else None
 
     async def delete(self, task_id: UUID) -> bool:
-        """Delete task by UUID, returns True if task existed"""
-        result = await self.connection.execute(
-            "DELETE FROM tasks WHERE id = $1", task_id
+        """Delete task by UUID and record a tombstone, True if task existed"""
+        deleted_id = await self.connection.fetchval(STATEMENTS["delete"], task_id)
+        return deleted_id is not None
+
+    async def apply_batch(
+        self,
+        updates: Sequence[
+            Tuple[UUID, Optional[str], Optional[str], Optional[str], Optional[int]]
+        ],
+        delete_ids: Sequence[UUID],
+    ) -> Tuple[List[Task], Set[UUID]]:
+        """
+        Apply many updates and deletes atomically with set-based statements.
+
+        Updates are (task_id, title, description, category, estimated_time)
+        tuples with the same unchanged/clear rules as update(). Returns the
+        updated tasks and the ids that were actually deleted.
+        """
+        updated: List[Task] = []
+        deleted: Set[UUID] = set()
+
+        async with self.connection.transaction():
+            if updates:
+                ids, titles, descriptions, categories, estimated_times = zip(
+                    *updates
+                )
+                rows = await self.connection.fetch(
+                    STATEMENTS["update_many"],
+                    list(ids),
+                    list(titles),
+                    [value is not UNSET for value in descriptions],
+                    [None if value is UNSET else value for value in descriptions],
+                    list(categories),
+                    [value is not UNSET for value in estimated_times],
+                    [None if value is UNSET else value for value in estimated_times],
+                )
+                updated = list(map(self._row_to_task, rows))
+
+            if delete_ids:
+                rows = await self.connection.fetch(
+                    STATEMENTS["delete_many"], list(delete_ids)
+                )
+                deleted = {row["id"] for row in rows}
+
+        return updated, deleted
+
+    async def get_tombstones(
+        self, after: Tuple[datetime, UUID], limit: int
+    ) -> List[Tuple[UUID, datetime]]:
+        """
+        Retrieve (id, deleted_at) of up to `limit` tasks deleted after the
+        (deleted_at, id) position `after`, in that order
+        """
+        rows = await self.connection.fetch(
+            STATEMENTS["get_tombstones"], after[0], after[1], limit
         )
-        return result == "DELETE 1"
-
-    def _row_to_task(self, row: asyncpg.Record) -> Task:
-        """Convert database row to Task domain model"""
-        return Task(
-            id=row["id"],
-            title=row["title"],
-            description=row["description"],
-            category=row["category"],
-            estimated_time=row["estimated_time"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
+        return [(row["id"], row["deleted_at"]) for row in rows]
+
+    async def compact_tombstones(self, before: datetime) -> int:
+        """Drop tombstones older than `before`, returns how many were removed"""
+        result = await self.connection.execute(
+            STATEMENTS["compact_tombstones"], before
         )
+        return int(result.split()[-1])
+
+    async def get_stats(self) -> List[Tuple[str, int, int]]:
+        """Retrieve (category, task_count, total_estimated_time) rows"""
+        rows = await self.connection.fetch(STATEMENTS["get_stats"])
+        return [tuple(row) for row in rows]
+
+    async def compute_stats(self) -> List[Tuple[str, int, int]]:
+        """Aggregate statistics directly from tasks (full scan)"""
+        rows = await self.connection.fetch(STATEMENTS["compute_stats"])
+        return [tuple(row) for row in rows]
+
+    async def rebuild_stats(self) -> None:
+        """Recompute task_stats from scratch while blocking concurrent writes"""
+        async with self.connection.transaction():
+            await self.connection.execute("LOCK TABLE tasks IN SHARE MODE")
+            await self.connection.execute("DELETE FROM task_stats")
+            await self.connection.execute(STATEMENTS["rebuild_stats"])
+
+
+    @staticmethod
+    def _row_to_task(row: asyncpg.Record) -> Task:
+        """
+        Convert database row to Task domain model.
+
+        Every task statement selects _TASK_COLUMNS in Task's argument order,
+        so the record unpacks positionally without per-column key lookups.
+        """
+        return Task(*row)
+
+
+async def prepare_statements(connection: asyncpg.Connection) -> None:
+    """
+    Pool `init` hook: prepare hot statements on each new connection.
+
+    Uses the same cached-prepare path asyncpg takes on a statement-cache
+    miss, so later fetch() calls with identical query text hit the cache
+    instead of paying a parse/plan round trip on first use.
+    """
+    for name in PREPARED_STATEMENTS:
+        await connection._prepare(STATEMENTS[name], use_cache=True)
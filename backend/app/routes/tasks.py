@@ -1,12 +1,65 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+)
 from uuid import UUID
 import asyncpg
 
-from backend.app.database import get_db_connection
-from backend.app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
-from backend.app.repositories.task_repository import TaskRepository
+from backend.app.config import get_settings
+from backend.app.consistency import reads_from_primary
+from backend.app.database import (
+    DatabaseConnectionPool,
+    get_db_connection,
+    get_read_connection,
+)
+from backend.app.etag import etag_matches, list_etag, not_modified, task_etag
+from backend.app.negotiation import (
+    COLUMNAR_MEDIA_TYPE,
+    MEDIA_TYPES,
+    MSGPACK_MEDIA_TYPE,
+    negotiate,
+    negotiated_response,
+    render,
+)
+from backend.app.schemas.task import (
+    CATEGORY_PATTERN,
+    TaskBatchOperation,
+    TaskBatchOperationResult,
+    TaskCreate,
+    TaskUpdate,
+    TaskResponse,
+    TaskPage,
+    TaskChanges,
+    TaskStats,
+)
+from backend.app.repositories.task_repository import (
+    DEFAULT_SORT,
+    UNSET,
+    TaskRepository,
+)
+from backend.app.services.pagination import (
+    InvalidCursorError,
+    SyncTokenExpiredError,
+)
+from backend.app.services.cache import get_task_cache
+from backend.app.services.coalescing import get_single_flight, task_flight_key
+from backend.app.services.events import (
+    SubscriberLimitError,
+    format_sse,
+    get_event_broadcaster,
+)
 from backend.app.services.task_service import TaskService
+from backend.app.serialization import TaskJSONResponse, dumps
 
 
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
@@ -17,7 +70,134 @@ def get_task_service(
 ) -> TaskService:
     """Dependency injection: provides TaskService with repository"""
     repository = TaskRepository(connection)
-    return TaskService(repository)
+    return TaskService(repository, cache=get_task_cache())
+
+
+def get_read_task_service(
+    connection: asyncpg.Connection = Depends(get_read_connection),
+) -> TaskService:
+    """
+    Dependency injection: TaskService for read-only routes, replica-backed.
+
+    The cache is bypassed when replicas are configured: a lagging replica
+    could otherwise refill it with rows a write has just invalidated.
+    """
+    return _read_service(connection)
+
+
+def _read_service(connection: asyncpg.Connection) -> TaskService:
+    repository = TaskRepository(connection)
+    cache = None if DatabaseConnectionPool().has_replicas else get_task_cache()
+    return TaskService(repository, cache=cache)
+
+
+async def _coalesced_read(
+    key: Hashable, readonly: bool, read: Callable[[TaskService], Awaitable[Any]]
+) -> Any:
+    """
+    Run `read` once for all concurrent requests with the same key.
+
+    The shared call checks out its own connection, so requests joining it
+    hold none while they wait. Raises asyncio.TimeoutError once
+    read_coalescing_timeout passes. Writes forget the in-flight reads they make
+    stale on their own worker; other workers only do so once the task_events
+    notification arrives, so there a request may still join an older read.
+    """
+
+    async def call():
+        async with DatabaseConnectionPool().acquire(readonly=readonly) as connection:
+            return await read(_read_service(connection))
+
+    settings = get_settings()
+    if not settings.read_coalescing_enabled:
+        return await call()
+    return await get_single_flight().do(
+        (*key, readonly), call, settings.read_coalescing_timeout
+    )
+
+
+def _read_timed_out() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Timed out waiting for the database",
+    )
+
+
+def get_task_filters(
+    category: Optional[str] = Query(None, pattern=CATEGORY_PATTERN),
+    min_estimated_time: Optional[int] = Query(None, ge=0),
+    max_estimated_time: Optional[int] = Query(None, ge=0),
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    updated_after: Optional[datetime] = None,
+    updated_before: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Dependency injection: collects list filters that were actually given"""
+    filters = {
+        "category": category,
+        "min_estimated_time": min_estimated_time,
+        "max_estimated_time": max_estimated_time,
+        "created_after": created_after,
+        "created_before": created_before,
+        "updated_after": updated_after,
+        "updated_before": updated_before,
+    }
+    return {name: value for name, value in filters.items() if value is not None}
+
+
+def _provided(update: TaskUpdate, field: str):
+    """Field value if the client sent it (even as null), otherwise UNSET"""
+    return getattr(update, field) if field in update.model_fields_set else UNSET
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Alternative list encodings, documented in OpenAPI next to plain JSON
+NEGOTIATED_CONTENT = {COLUMNAR_MEDIA_TYPE: {}, MSGPACK_MEDIA_TYPE: {}}
+
+
+async def _stream_tasks_ndjson(
+    batch_size: int, readonly: bool = False
+) -> AsyncIterator[bytes]:
+    """
+    Yield all tasks as newline-delimited JSON, `batch_size` rows per chunk.
+
+    Acquires its own pool connection because request-scoped dependencies are
+    released before a streaming response body starts being sent.
+    """
+    async with DatabaseConnectionPool().acquire(readonly=readonly) as connection:
+        service = TaskService(TaskRepository(connection))
+        lines = []
+        async for task in service.stream_all_tasks(batch_size=batch_size):
+            lines.append(dumps(task))
+            if len(lines) >= batch_size:
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+        if lines:
+            yield b"\n".join(lines) + b"\n"
+
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+async def _stream_task_events(queue: asyncio.Queue, keepalive: float):
+    """
+    Yield queued task change events as Server-Sent Events.
+
+    A comment line is sent when the feed is idle so proxies keep the
+    connection open; the subscription is dropped when the client goes away.
+    """
+    broadcaster = get_event_broadcaster()
+    try:
+        while True:
+            try:
+                payload = await asyncio.wait_for(queue.get(), timeout=keepalive)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            yield format_sse(payload)
+    finally:
+        broadcaster.unsubscribe(queue)
 
 
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
@@ -31,7 +211,7 @@ async def create_task(
             description=task.description,
             estimated_time=task.estimated_time,
         )
-        return created_task.to_dict()
+        return TaskJSONResponse(created_task, status_code=status.HTTP_201_CREATED)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -39,12 +219,171 @@ async def create_task(
         )
 
 
-@router.get("", response_model=List[TaskResponse])
-async def get_all_tasks(service: TaskService = Depends(get_task_service)):
-    """Retrieve all tasks"""
+@router.post(
+    "/batch",
+    response_model=List[TaskResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_tasks_batch(
+    tasks: List[TaskCreate], service: TaskService = Depends(get_task_service)
+):
+    """Create many tasks at once with automatic categorization"""
+    max_size = get_settings().tasks_batch_max_size
+    if len(tasks) > max_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch size exceeds maximum of {max_size} tasks",
+        )
+    try:
+        created_tasks = await service.create_tasks(
+            [(task.title, task.description, task.estimated_time) for task in tasks]
+        )
+        return TaskJSONResponse(created_tasks, status_code=status.HTTP_201_CREATED)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create tasks: {str(e)}",
+        )
+
+
+@router.post("/batch-ops", response_model=List[TaskBatchOperationResult])
+async def apply_batch_operations(
+    operations: List[TaskBatchOperation],
+    service: TaskService = Depends(get_task_service),
+):
+    """Apply many updates and deletes in a single transaction"""
+    max_size = get_settings().tasks_batch_max_size
+    if len(operations) > max_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch size exceeds maximum of {max_size} operations",
+        )
+    if len({operation.id for operation in operations}) != len(operations):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Each task may appear in at most one operation",
+        )
+
+    updates = [
+        (
+            op.id,
+            op.title,
+            _provided(op, "description"),
+            op.category,
+            _provided(op, "estimated_time"),
+        )
+        for op in operations
+        if op.op == "update"
+    ]
+    # PUT treats an empty update as a read; here it would still bump updated_at
+    if any(update[1:] == (None, UNSET, None, UNSET) for update in updates):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Each update operation must change at least one field",
+        )
+    delete_ids = [op.id for op in operations if op.op == "delete"]
+    try:
+        updated, deleted = await service.apply_batch_operations(updates, delete_ids)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to apply batch operations: {str(e)}",
+        )
+
+    results = []
+    for operation in operations:
+        if operation.op == "update" and operation.id in updated:
+            results.append(
+                {
+                    "id": operation.id,
+                    "op": operation.op,
+                    "status": "updated",
+                    "task": updated[operation.id],
+                }
+            )
+        elif operation.op == "delete" and operation.id in deleted:
+            results.append(
+                {"id": operation.id, "op": operation.op, "status": "deleted"}
+            )
+        else:
+            results.append(
+                {"id": operation.id, "op": operation.op, "status": "not_found"}
+            )
+    return TaskJSONResponse(results)
+
+
+@router.get(
+    "",
+    response_model=TaskPage,
+    responses={200: {"content": {**NEGOTIATED_CONTENT, NDJSON_MEDIA_TYPE: {}}}},
+)
+async def get_all_tasks(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    sort: str = Query(DEFAULT_SORT, pattern="^-?(created_at|updated_at)$"),
+    stream: bool = False,
+    filters: Dict[str, Any] = Depends(get_task_filters),
+):
+    """
+    Retrieve tasks one page at a time, newest first unless `sort` says
+    otherwise (prefix with '-' for descending), optionally filtered.
+
+    With `?stream=1` or `Accept: application/x-ndjson` the full list is
+    streamed as NDJSON instead, ignoring pagination and filter parameters.
+    Concurrent requests for the same page share one query and its encoded body.
+    Like the other list routes, answers with MessagePack or columnar JSON
+    when the Accept header asks for it, compressed when large enough.
+    """
+    settings = get_settings()
+    readonly = not reads_from_primary(request)
+    # NDJSON only when asked for by name: wildcards and ties pick a page
+    representation = negotiate(request, (*MEDIA_TYPES, NDJSON_MEDIA_TYPE))
+    if stream or representation.media_type == NDJSON_MEDIA_TYPE:
+        return StreamingResponse(
+            _stream_tasks_ndjson(settings.tasks_stream_batch_size, readonly=readonly),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
+    page_size = min(
+        limit or settings.tasks_page_default_limit, settings.tasks_page_max_limit
+    )
+
+    params = (page_size, cursor, sort, tuple(sorted(filters.items())), *representation)
+
+    async def read_page(service: TaskService) -> tuple:
+        # The ETag comes from the version read in the page's own snapshot:
+        # a write may have landed since any If-None-Match check below
+        version, tasks, next_cursor = await service.get_versioned_page(
+            page_size, cursor, sort=sort, **filters
+        )
+        content = {"items": tasks, "next_cursor": next_cursor}
+        rendered = render(
+            content, representation, settings.response_compression_min_size
+        )
+        return list_etag(version, *params), rendered
+
     try:
-        tasks = await service.get_all_tasks()
-        return [task.to_dict() for task in tasks]
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            # Revalidation reads only the change counter while nothing changed
+            version = await _coalesced_read(
+                ("list_version",), readonly, lambda service: service.get_list_version()
+            )
+            etag = list_etag(version, *params)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+        etag, rendered = await _coalesced_read(("page", *params), readonly, read_page)
+        return negotiated_response(
+            rendered,
+            representation,
+            headers={"ETag": etag, "Cache-Control": "no-cache"},
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except asyncio.TimeoutError:
+        raise _read_timed_out()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -52,15 +391,190 @@ async def get_all_tasks(service: TaskService = Depends(get_task_service)):
         )
 
 
+@router.get(
+    "/search",
+    response_model=TaskPage,
+    responses={200: {"content": NEGOTIATED_CONTENT}},
+)
+async def search_tasks(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    service: TaskService = Depends(get_read_task_service),
+):
+    """Full-text search over task titles and descriptions, best matches first"""
+    settings = get_settings()
+    page_size = min(
+        limit or settings.tasks_page_default_limit, settings.tasks_page_max_limit
+    )
+    try:
+        tasks, next_cursor = await service.search_tasks(q, page_size, cursor)
+        representation = negotiate(request)
+        return negotiated_response(
+            render(
+                {"items": tasks, "next_cursor": next_cursor},
+                representation,
+                settings.response_compression_min_size,
+            ),
+            representation,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to search tasks: {str(e)}",
+        )
+
+
+@router.get(
+    "/changes",
+    response_model=TaskChanges,
+    responses={200: {"content": NEGOTIATED_CONTENT}},
+)
+async def get_task_changes(
+    request: Request,
+    since: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    service: TaskService = Depends(get_task_service),
+):
+    """
+    Delta sync: tasks changed and ids deleted since the `since` token.
+
+    Omit `since` for a full sync. Pass back `next_token` on the next call,
+    immediately while `has_more` is true. A 410 means the token is older
+    than the tombstone retention period and the client must resync fully.
+    Served by the primary: replica lag could exceed the token's settle
+    window and silently skip changes.
+    """
+    settings = get_settings()
+    page_size = min(
+        limit or settings.tasks_page_default_limit, settings.tasks_page_max_limit
+    )
+    try:
+        tasks, deleted, next_token, has_more = await service.get_changes(
+            page_size,
+            since,
+            settle=timedelta(seconds=settings.task_changes_settle_seconds),
+            retention=timedelta(days=settings.task_tombstone_retention_days),
+        )
+        representation = negotiate(request)
+        return negotiated_response(
+            render(
+                {
+                    "tasks": tasks,
+                    "deleted": deleted,
+                    "next_token": next_token,
+                    "has_more": has_more,
+                },
+                representation,
+                settings.response_compression_min_size,
+            ),
+            representation,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except SyncTokenExpiredError as e:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve task changes: {str(e)}",
+        )
+
+
+@router.get("/stats", response_model=TaskStats)
+async def get_task_stats(service: TaskService = Depends(get_read_task_service)):
+    """Task counts and total estimated time per category"""
+    try:
+        return await service.get_stats()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve task stats: {str(e)}",
+        )
+
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """Report task cache hit/miss/eviction counters"""
+    cache = get_task_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+@router.get("/events")
+async def stream_task_events():
+    """
+    Push task changes to the client as Server-Sent Events.
+
+    Each event's data is JSON with `type` (created, updated or deleted),
+    `id` and, except for deletes, `updated_at`. A `resync` event means the
+    client fell behind and events were dropped, so it should refetch.
+    """
+    try:
+        queue = await get_event_broadcaster().subscribe()
+    except SubscriberLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to subscribe to task events: {str(e)}",
+        )
+
+    return StreamingResponse(
+        _stream_task_events(queue, get_settings().task_events_keepalive),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{task_id}", response_model=TaskResponse)
-async def get_task(task_id: UUID, service: TaskService = Depends(get_task_service)):
-    """Retrieve single task by ID"""
-    task = await service.get_task(task_id)
-    if not task:
+async def get_task(task_id: UUID, request: Request):
+    """
+    Retrieve single task by ID, answering 304 if the client copy is current.
+
+    Concurrent requests for the same task share one query and its encoded body.
+    """
+    readonly = not reads_from_primary(request)
+
+    async def read_task(service: TaskService) -> Optional[tuple]:
+        task = await service.get_task(task_id)
+        if task is None:
+            return None
+        return task_etag(task.id, task.updated_at), dumps(task)
+
+    try:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            updated_at = await _coalesced_read(
+                task_flight_key(task_id, "updated_at"),
+                readonly,
+                lambda service: service.get_task_updated_at(task_id),
+            )
+            if updated_at is not None:
+                etag = task_etag(task_id, updated_at)
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+
+        found = await _coalesced_read(task_flight_key(task_id), readonly, read_task)
+    except asyncio.TimeoutError:
+        raise _read_timed_out()
+
+    if found is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
         )
-    return task.to_dict()
+    etag, body = found
+    return Response(
+        body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
@@ -73,9 +587,9 @@ async def update_task(
     updated_task = await service.update_task(
         task_id=task_id,
         title=task_update.title,
-        description=task_update.description,
+        description=_provided(task_update, "description"),
         category=task_update.category,
-        estimated_time=task_update.estimated_time,
+        estimated_time=_provided(task_update, "estimated_time"),
     )
 
     if not updated_task:
@@ -83,7 +597,7 @@ async def update_task(
             status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
         )
 
-    return updated_task.to_dict()
+    return TaskJSONResponse(updated_task)
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,3 +1,23 @@
-from backend.app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from backend.app.schemas.task import (
+    TaskCreate,
+    TaskUpdate,
+    TaskResponse,
+    TaskPage,
+    TaskChanges,
+    TaskBatchOperation,
+    TaskBatchOperationResult,
+    CategoryStats,
+    TaskStats,
+)
 
-__all__ = ["TaskCreate", "TaskUpdate", "TaskResponse"]
+__all__ = [
+    "TaskCreate",
+    "TaskUpdate",
+    "TaskResponse",
+    "TaskPage",
+    "TaskChanges",
+    "TaskBatchOperation",
+    "TaskBatchOperationResult",
+    "CategoryStats",
+    "TaskStats",
+]
@@ -1,8 +1,12 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 from uuid import UUID
 
+# Categories tasks may be filtered by and set to; keyword rules must use these
+TASK_CATEGORIES = ("work", "personal", "urgent")
+CATEGORY_PATTERN = f"^({'|'.join(TASK_CATEGORIES)})$"
+
 
 class TaskCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=200)
@@ -13,7 +17,7 @@ class TaskCreate(BaseModel):
 class TaskUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = Field(None, max_length=2000)
-    category: Optional[str] = Field(None, pattern="^(work|personal|urgent)$")
+    category: Optional[str] = Field(None, pattern=CATEGORY_PATTERN)
     estimated_time: Optional[int] = Field(None, ge=0, le=1440)
 
 
@@ -28,3 +32,39 @@ class TaskResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TaskPage(BaseModel):
+    items: List[TaskResponse]
+    next_cursor: Optional[str] = None
+
+
+class TaskChanges(BaseModel):
+    tasks: List[TaskResponse]
+    deleted: List[UUID]
+    next_token: str
+    has_more: bool
+
+
+class TaskBatchOperation(TaskUpdate):
+    op: Literal["update", "delete"]
+    id: UUID
+
+
+class TaskBatchOperationResult(BaseModel):
+    id: UUID
+    op: Literal["update", "delete"]
+    status: Literal["updated", "deleted", "not_found"]
+    task: Optional[TaskResponse] = None
+
+
+class CategoryStats(BaseModel):
+    category: str
+    count: int
+    total_estimated_time: int
+
+
+class TaskStats(BaseModel):
+    categories: List[CategoryStats]
+    total_count: int
+    total_estimated_time: int
@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+from uuid import UUID
+
+import msgpack
+import orjson
+from fastapi.responses import ORJSONResponse
+
+from backend.app.models.task import Task
+
+# Matches the wire format pydantic produced for TaskResponse (UTC as "Z")
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _encode_default(obj: Any) -> Any:
+    """Encode domain objects orjson does not know about natively"""
+    if isinstance(obj, Task):
+        return {
+            "id": obj.id,
+            "title": obj.title,
+            "description": obj.description,
+            "category": obj.category,
+            "estimated_time": obj.estimated_time,
+            "created_at": obj.created_at,
+            "updated_at": obj.updated_at,
+        }
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content containing Task objects straight to JSON bytes"""
+    return orjson.dumps(content, default=_encode_default, option=_ORJSON_OPTIONS)
+
+
+# Response keys holding lists of tasks, turned into columns by dumps_columnar()
+TASK_LIST_KEYS = ("items", "tasks")
+TASK_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "category",
+    "estimated_time",
+    "created_at",
+    "updated_at",
+)
+
+
+def to_columns(tasks: List[Task]) -> Dict[str, list]:
+    """One array per task field instead of one object per task"""
+    return {field: [getattr(task, field) for task in tasks] for field in TASK_FIELDS}
+
+
+def dumps_columnar(content: Dict[str, Any]) -> bytes:
+    """Serialize a response dict to JSON with its task lists stored as columns"""
+    return dumps(
+        {
+            key: to_columns(value) if key in TASK_LIST_KEYS else value
+            for key, value in content.items()
+        }
+    )
+
+
+def _encode_msgpack_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        # Naive timestamps are UTC, as in the JSON output
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        # Integer arithmetic: from_datetime() goes through a float timestamp
+        # and can be a microsecond off
+        delta = obj - _EPOCH
+        return msgpack.Timestamp(
+            delta.days * 86400 + delta.seconds, delta.microseconds * 1000
+        )
+    if isinstance(obj, UUID):
+        return str(obj)
+    return _encode_default(obj)
+
+
+def dumps_msgpack(content: Any) -> bytes:
+    """Serialize content to MessagePack, datetimes as native timestamps"""
+    return msgpack.packb(content, default=_encode_msgpack_default)
+
+
+class TaskJSONResponse(ORJSONResponse):
+    """
+    JSON response that encodes Task objects directly.
+
+    UUIDs and datetimes are written by orjson in a single pass, skipping the
+    to_dict() and response_model round trip; routes keep response_model so
+    the OpenAPI schema is unchanged.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,63 @@
+"""
+Production entry point: multi-worker uvicorn with per-worker pool sizing.
+
+    python -m backend.app.server
+
+Worker count, bind address and graceful shutdown timeout come from Settings
+(SERVER_WORKERS, SERVER_HOST, SERVER_PORT, SERVER_GRACEFUL_TIMEOUT). Set
+DB_CONNECTION_BUDGET to divide a fixed number of database connections
+between the workers.
+"""
+
+import logging
+import os
+from typing import Any, Dict
+
+import uvicorn
+
+from backend.app.config import get_settings
+from backend.app.database import pool_size_limits, worker_count
+
+logger = logging.getLogger(__name__)
+
+
+def build_config() -> Dict[str, Any]:
+    """
+    uvicorn.run() keyword arguments for the configured deployment.
+
+    uvloop and httptools are selected explicitly rather than left to
+    uvicorn's auto-detection. On SIGTERM uvicorn stops accepting
+    connections, waits up to the graceful timeout for in-flight requests and
+    only then runs the lifespan shutdown that closes the pools.
+    """
+    settings = get_settings()
+    return {
+        "host": settings.server_host,
+        "port": settings.server_port,
+        "workers": worker_count(),
+        "loop": "uvloop",
+        "http": "httptools",
+        "timeout_graceful_shutdown": settings.server_graceful_timeout,
+        "proxy_headers": True,
+    }
+
+
+def main() -> None:
+    config = build_config()
+    # Fail before forking if the connection budget cannot cover every worker
+    min_size, max_size = pool_size_limits()
+    # Workers read their Settings from the environment, so pin the resolved
+    # count for them; pool_size_limits() must divide by the same number
+    os.environ["SERVER_WORKERS"] = str(config["workers"])
+    logging.basicConfig(level=logging.INFO)
+    logger.info(
+        "Starting %d workers, database pool %d-%d connections each",
+        config["workers"],
+        min_size,
+        max_size,
+    )
+    uvicorn.run("backend.app.main:app", **config)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import json
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Optional
+
+from backend.app.config import get_settings
+
+# Invalidation payloads other than a task id
+INVALIDATE_PAGES = "pages"
+INVALIDATE_ALL = "*"
+
+
+class TTLCache:
+    """
+    In-process LRU cache whose entries also expire after a fixed TTL.
+
+    `version` increases on every invalidation; readers capture it before
+    going to the database and pass it to set(), so a value fetched before a
+    concurrent write landed is never stored.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.evictions += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, version: Optional[int] = None) -> None:
+        if version is not None and version != self.version:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self.version += 1
+        self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate) -> None:
+        self.version += 1
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self.version += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def task_key(task_id) -> tuple:
+    return ("task", str(task_id))
+
+
+def page_key(limit: int, version: Optional[int] = None) -> tuple:
+    return ("page", limit, version)
+
+
+def is_page_key(key: tuple) -> bool:
+    return key[0] == "page"
+
+
+def apply_invalidation(cache: TTLCache, payload: str) -> None:
+    """Apply an invalidation message (task id, 'pages' or '*') to the cache"""
+    if payload == INVALIDATE_ALL:
+        cache.clear()
+        return
+
+    cache.invalidate_where(is_page_key)
+    if payload != INVALIDATE_PAGES:
+        cache.invalidate(("task", payload))
+
+
+@lru_cache()
+def get_task_cache() -> Optional[TTLCache]:
+    """Singleton pattern: the worker's task cache, or None when disabled"""
+    settings = get_settings()
+    if not settings.task_cache_enabled:
+        return None
+    return TTLCache(max_size=settings.task_cache_max_size, ttl=settings.task_cache_ttl)
+
+
+def invalidations_shared() -> bool:
+    """Whether writes must reach other workers' caches or coalesced reads"""
+    settings = get_settings()
+    return settings.task_cache_enabled or settings.read_coalescing_enabled
+
+
+def _invalidate_local(payloads) -> None:
+    """Apply invalidation payloads to this worker's cache and coalesced reads"""
+    # Imported here: coalescing reuses this module's invalidation payloads
+    from backend.app.services.coalescing import (
+        apply_invalidation as invalidate_flights,
+        get_single_flight,
+    )
+
+    flights = get_single_flight()
+    cache = get_task_cache()
+    for payload in payloads:
+        invalidate_flights(flights, payload)
+        if cache is not None:
+            apply_invalidation(cache, payload)
+
+
+def on_task_event_notify(_connection, _pid: int, _channel: str, payload: str):
+    """
+    asyncpg listener callback for task_events: invalidate what a write changed.
+
+    The tasks triggers publish every change when it commits, this worker's
+    own included; those were already applied locally and repeat harmlessly.
+    """
+    event = json.loads(payload)
+    if event["type"] == "created":
+        _invalidate_local([INVALIDATE_PAGES])
+    else:
+        _invalidate_local(event["ids"])
+
+
+def on_invalidation_reconnect() -> None:
+    """Invalidations were missed while the LISTEN connection was down"""
+    _invalidate_local([INVALIDATE_ALL])
@@ -1,7 +1,8 @@
 from backend.app.services.categorization.factory import CategorizerFactory
 from backend.app.services.categorization.strategies import (
+    KeywordMatcher,
     KeywordStrategy,
     PatternStrategy,
 )
 
-__all__ = ["CategorizerFactory", "KeywordStrategy", "PatternStrategy"]
+__all__ = ["CategorizerFactory", "KeywordMatcher", "KeywordStrategy", "PatternStrategy"]
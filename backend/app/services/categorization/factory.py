@@ -1,32 +1,153 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple, Type
+
+from backend.app.config import get_settings
+from backend.app.schemas.task import TASK_CATEGORIES
 from backend.app.services.categorization.strategies import (
     CategorizationStrategy,
     KeywordStrategy,
     PatternStrategy,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def load_keyword_rules(path: str) -> List[Tuple[str, Set[str]]]:
+    """
+    Load keyword rules from a JSON file.
+
+    The file maps category names to keyword lists; key order is priority
+    order, e.g. {"urgent": [...], "work": [...], "personal": [...]}.
+
+    Raises:
+        OSError: the file cannot be read
+        ValueError: the file is not valid JSON of that shape, names a
+            category outside TASK_CATEGORIES, or defines no keywords at all
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    if not isinstance(data, dict):
+        raise ValueError("Keyword file must map categories to keyword lists")
+    for category, keywords in data.items():
+        if category not in TASK_CATEGORIES:
+            raise ValueError(
+                f"Unknown category {category!r}; expected one of {TASK_CATEGORIES}"
+            )
+        if not isinstance(keywords, list) or not all(
+            isinstance(keyword, str) and keyword.strip() for keyword in keywords
+        ):
+            raise ValueError(
+                f"Keywords for {category!r} must be a list of non-empty strings"
+            )
+    if not any(data.values()):
+        raise ValueError("Keyword file defines no keywords")
+    return [(category, set(keywords)) for category, keywords in data.items()]
+
 
 class CategorizerFactory:
     """
     Factory pattern: creates appropriate categorizer based on strategy type.
 
-    Centralizes categorizer creation logic and allows easy addition of new strategies.
+    Acts as a registry of long-lived, shared strategy instances so request
+    handling never builds categorizers. New strategies are added with
+    register(); keyword rules can be hot-reloaded from a JSON file.
     """
 
-    @staticmethod
-    def create_categorizer(strategy_type: str = "keyword") -> CategorizationStrategy:
+    _strategies: Dict[str, Type[CategorizationStrategy]] = {
+        "keyword": KeywordStrategy,
+        "pattern": PatternStrategy,
+    }
+    _instances: Dict[str, CategorizationStrategy] = {}
+    _keyword_rules: Optional[List[Tuple[str, Set[str]]]] = None
+    _keywords_mtime: Optional[float] = None
+    _next_reload_check: float = 0.0
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(
+        cls, strategy_type: str, strategy_class: Type[CategorizationStrategy]
+    ) -> None:
+        """Register (or replace) a strategy class under the given name"""
+        with cls._lock:
+            cls._strategies[strategy_type] = strategy_class
+            cls._instances.pop(strategy_type, None)
+
+    @classmethod
+    def create_categorizer(
+        cls, strategy_type: str = "keyword"
+    ) -> CategorizationStrategy:
         """
-        Creates and returns a categorization strategy instance.
+        Returns the shared categorization strategy instance.
 
         Args:
-            strategy_type: Type of strategy ('keyword', 'pattern', or future 'ml')
+            strategy_type: Type of strategy ('keyword', 'pattern', or any
+                registered name); unknown names fall back to 'keyword'
 
         Returns:
             CategorizationStrategy instance
         """
-        strategies = {
-            "keyword": KeywordStrategy,
-            "pattern": PatternStrategy,
-        }
+        if strategy_type not in cls._strategies:
+            strategy_type = "keyword"
+
+        instance = cls._instances.get(strategy_type)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.get(strategy_type)
+                if instance is None:
+                    instance = cls._strategies[strategy_type]()
+                    if cls._keyword_rules is not None:
+                        instance.reload_keywords(cls._keyword_rules)
+                    cls._instances[strategy_type] = instance
+        return instance
+
+    @classmethod
+    def get_categorizer(cls) -> CategorizationStrategy:
+        """Return the strategy selected in Settings, reloading keywords if stale"""
+        settings = get_settings()
+        if settings.categorization_keywords_file:
+            cls._reload_if_changed(
+                settings.categorization_keywords_file,
+                settings.categorization_reload_interval,
+            )
+        return cls.create_categorizer(settings.categorization_strategy)
+
+    @classmethod
+    def reload_keywords(cls, rules: List[Tuple[str, Set[str]]]) -> None:
+        """Apply new keyword rules to every shared strategy instance"""
+        with cls._lock:
+            cls._keyword_rules = rules
+            for instance in cls._instances.values():
+                instance.reload_keywords(rules)
+
+    @classmethod
+    def _reload_if_changed(cls, path: str, interval: float) -> None:
+        """
+        Reload keyword rules if the file was modified, throttled to interval.
+
+        A file that cannot be loaded (e.g. caught half-written) is logged and
+        the current rules are kept; it is retried on the next check.
+        """
+        now = time.monotonic()
+        if now < cls._next_reload_check:
+            return
+        cls._next_reload_check = now + interval
+
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return
+        if mtime == cls._keywords_mtime:
+            return
 
-        strategy_class = strategies.get(strategy_type, KeywordStrategy)
-        return strategy_class()
+        try:
+            rules = load_keyword_rules(path)
+        except (OSError, ValueError) as e:
+            logger.warning("Keeping current keyword rules, cannot load %s: %s", path, e)
+            return
+        cls._keywords_mtime = mtime
+        cls.reload_keywords(rules)
@@ -0,0 +1,82 @@
+import asyncio
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from backend.app.services.cache import INVALIDATE_ALL, INVALIDATE_PAGES
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call among concurrent callers asking for the same key.
+
+    The first caller starts the call; callers arriving while it runs await
+    the same result instead of repeating the work. Each caller waits at most
+    `timeout` seconds, and a timed-out or invalidated flight is forgotten so
+    later callers start a fresh call rather than joining a stale one.
+    """
+
+    def __init__(self):
+        self.started = 0
+        self.shared = 0
+        self._flights: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(
+        self, key: Hashable, call: Callable[[], Awaitable[T]], timeout: float
+    ) -> T:
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._flights[key] = task
+            task.add_done_callback(lambda done: self._discard(key, done))
+            self.started += 1
+        else:
+            self.shared += 1
+
+        try:
+            # Shielded so one caller giving up does not cancel the others
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            self._discard(key, task)
+            raise
+
+    def forget(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> None:
+        """Detach matching flights; callers already waiting still get results"""
+        for key in [k for k in self._flights if predicate is None or predicate(k)]:
+            del self._flights[key]
+
+    def _discard(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if task.done() and not task.cancelled():
+            # Mark the exception retrieved even if every caller timed out
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._flights),
+            "started": self.started,
+            "shared": self.shared,
+        }
+
+
+def task_flight_key(task_id, *parts: Hashable) -> tuple:
+    return ("task", str(task_id), *parts)
+
+
+def apply_invalidation(flights: SingleFlight, payload: str) -> None:
+    """Forget flights a write made stale: same payloads as the task cache"""
+    if payload == INVALIDATE_ALL:
+        flights.forget()
+        return
+
+    flights.forget(lambda key: key[0] != "task")
+    if payload != INVALIDATE_PAGES:
+        flights.forget(lambda key: key[:2] == ("task", payload))
+
+
+@lru_cache()
+def get_single_flight() -> SingleFlight:
+    """Singleton pattern: the worker's read coalescing registry"""
+    return SingleFlight()
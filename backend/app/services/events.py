@@ -0,0 +1,94 @@
+import asyncio
+from functools import lru_cache
+from typing import Optional, Set
+
+from backend.app.config import get_settings
+from backend.app.database import DatabaseConnectionPool
+
+# Postgres NOTIFY channel fed by the trg_tasks_notify_* statement triggers
+TASK_EVENTS_CHANNEL = "task_events"
+
+# Sent in place of a subscriber's backlog when it falls too far behind
+RESYNC_EVENT = '{"type": "resync"}'
+
+
+class SubscriberLimitError(RuntimeError):
+    """Raised when a worker already serves the maximum number of subscribers"""
+
+
+class EventBroadcaster:
+    """
+    Fans out task change notifications to subscribers in this worker.
+
+    One LISTEN on the pool's shared listener connection feeds every
+    subscriber. Each subscriber has a bounded queue; a subscriber that falls
+    behind has its backlog replaced by a single resync event instead of
+    growing memory or slowing everyone else down.
+    """
+
+    def __init__(self, queue_size: int, max_subscribers: int):
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._listening = False
+        self._listen_lock = asyncio.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def subscribe(self) -> asyncio.Queue:
+        if len(self._subscribers) >= self.max_subscribers:
+            raise SubscriberLimitError("Too many event subscribers")
+        await self._ensure_listening()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def publish(self, payload: str) -> None:
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                # Drop the backlog; the client refetches on resync
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC_EVENT)
+
+    def on_notify(self, _connection, _pid: int, _channel: str, payload: str):
+        """asyncpg listener callback"""
+        self.publish(payload)
+
+    def on_reconnect(self) -> None:
+        """Events were missed while the LISTEN connection was down"""
+        self.publish(RESYNC_EVENT)
+
+    async def _ensure_listening(self) -> None:
+        # LISTEN lazily so workers without subscribers hold no extra connection
+        if self._listening:
+            return
+        async with self._listen_lock:
+            if not self._listening:
+                await DatabaseConnectionPool().add_listener(
+                    TASK_EVENTS_CHANNEL, self.on_notify, on_reconnect=self.on_reconnect
+                )
+                self._listening = True
+
+
+@lru_cache()
+def get_event_broadcaster() -> EventBroadcaster:
+    """Singleton pattern: the worker's task event broadcaster"""
+    settings = get_settings()
+    return EventBroadcaster(
+        queue_size=settings.task_events_queue_size,
+        max_subscribers=settings.task_events_max_subscribers,
+    )
+
+
+def format_sse(payload: str, event: Optional[str] = None) -> bytes:
+    """Encode one Server-Sent Events message"""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {payload}\n\n".encode()
@@ -0,0 +1,51 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+class SyncTokenExpiredError(ValueError):
+    """Raised when a sync token predates the retained tombstones"""
+
+
+def encode_cursor(created_at: datetime, task_id: UUID) -> str:
+    """Encode the (created_at, id) keyset position as an opaque URL-safe token"""
+    raw = f"{created_at.isoformat()}|{task_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a token produced by encode_cursor back into its keyset position"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at, task_id = raw.split("|", 1)
+        position = datetime.fromisoformat(created_at), UUID(task_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+    # Timestamps are timestamptz: a naive one cannot be compared or bound safely
+    if position[0].tzinfo is None:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return position
+
+
+def encode_rank_cursor(rank: float, task_id: UUID) -> str:
+    """Encode the (rank, id) keyset position of a ranked search result"""
+    raw = f"{rank!r}|{task_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, UUID]:
+    """Decode a token produced by encode_rank_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        rank, task_id = raw.split("|", 1)
+        return float(rank), UUID(task_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
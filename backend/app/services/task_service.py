@@ -1,21 +1,51 @@
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 from uuid import UUID
-from backend.app.repositories.task_repository import TaskRepository
+from backend.app.repositories.task_repository import (
+    DEFAULT_SORT,
+    UNSET,
+    TaskRepository,
+)
 from backend.app.services.categorization.factory import CategorizerFactory
+from backend.app.services.pagination import (
+    SyncTokenExpiredError,
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+)
+from backend.app.services.cache import (
+    INVALIDATE_ALL,
+    INVALIDATE_PAGES,
+    TTLCache,
+    apply_invalidation,
+    page_key,
+    task_key,
+)
+from backend.app.services.coalescing import (
+    apply_invalidation as invalidate_flights,
+    get_single_flight,
+)
 from backend.app.models.task import Task
+from backend.app.tracing import trace_operation
+
+# Sorts before every real id at the same timestamp in a sync position
+_MIN_UUID = UUID(int=0)
 
 
 class TaskService:
     """
     Service layer: orchestrates business logic between routes and repositories.
 
-    Handles task categorization using Factory and Strategy patterns.
+    Handles task categorization using Factory and Strategy patterns, and
+    keeps the optional read-through cache coherent with writes.
     """
 
-    def __init__(self, repository: TaskRepository):
+    def __init__(self, repository: TaskRepository, cache: Optional[TTLCache] = None):
         self.repository = repository
-        # Factory pattern: create categorizer instance
-        self.categorizer = CategorizerFactory.create_categorizer("keyword")
+        self.cache = cache
+        # Factory pattern: shared categorizer instance selected via Settings
+        self.categorizer = CategorizerFactory.get_categorizer()
 
     async def create_task(
         self, title: str, description: Optional[str], estimated_time: Optional[int]
@@ -25,40 +55,297 @@ class TaskService:
 
         Uses Strategy pattern via Factory to determine category from content.
         """
-        category = self.categorizer.categorize(title, description)
+        with trace_operation("categorize"):
+            category = self.categorizer.categorize(title, description)
 
-        return await self.repository.create(
+        task = await self.repository.create(
             title=title,
             description=description,
             category=category,
             estimated_time=estimated_time,
         )
+        await self._invalidate(INVALIDATE_PAGES)
+        return task
+
+    async def create_tasks(
+        self, items: List[Tuple[str, Optional[str], Optional[int]]]
+    ) -> List[Task]:
+        """
+        Create a batch of tasks with automatic categorization.
+
+        Items are (title, description, estimated_time) tuples; all of them are
+        categorized up front and written with a single statement.
+        """
+        with trace_operation("categorize_many"):
+            categories = self.categorizer.categorize_many(
+                (title, description) for title, description, _ in items
+            )
+        rows = [
+            (title, description, category, estimated_time)
+            for (title, description, estimated_time), category in zip(
+                items, categories
+            )
+        ]
+        tasks = await self.repository.create_many(rows)
+        if tasks:
+            await self._invalidate(INVALIDATE_PAGES)
+        return tasks
 
     async def get_task(self, task_id: UUID) -> Optional[Task]:
-        """Retrieve single task by ID"""
-        return await self.repository.get_by_id(task_id)
+        """Retrieve single task by ID, served from the cache when enabled"""
+        if self.cache is None:
+            return await self.repository.get_by_id(task_id)
+
+        key = task_key(task_id)
+        task = self.cache.get(key)
+        if task is None:
+            version = self.cache.version
+            task = await self.repository.get_by_id(task_id)
+            if task is not None:
+                self.cache.set(key, task, version=version)
+        return task
+
+    async def get_task_updated_at(self, task_id: UUID) -> Optional[datetime]:
+        """Retrieve when a task last changed, for conditional requests"""
+        return await self.repository.get_updated_at(task_id)
+
+    async def get_list_version(self) -> int:
+        """Retrieve the task list change counter, for conditional requests"""
+        return await self.repository.get_change_version()
+
+    async def get_versioned_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort: str = DEFAULT_SORT,
+        **filters: Any,
+    ) -> Tuple[int, List[Task], Optional[str]]:
+        """
+        Retrieve the list change counter and one page from a single snapshot.
+
+        The counter identifies exactly the rows returned, so an ETag built
+        from it can never describe a newer list than the body it is sent with.
+        """
+        async with self.repository.snapshot():
+            version = await self.get_list_version()
+            tasks, next_cursor = await self.get_tasks_page(
+                limit, cursor, sort=sort, list_version=version, **filters
+            )
+        return version, tasks, next_cursor
 
     async def get_all_tasks(self) -> List[Task]:
         """Retrieve all tasks"""
         return await self.repository.get_all()
 
+    def stream_all_tasks(self, batch_size: int = 500) -> AsyncIterator[Task]:
+        """Iterate over all tasks without materializing the full list"""
+        return self.repository.iter_all(prefetch=batch_size)
+
+    async def get_tasks_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort: str = DEFAULT_SORT,
+        list_version: Optional[int] = None,
+        **filters: Any,
+    ) -> Tuple[List[Task], Optional[str]]:
+        """
+        Retrieve one page of tasks and the cursor for the following page.
+
+        Fetches one extra row to detect whether another page exists, so the
+        last page returns no cursor without an additional query. `filters`
+        are passed through to TaskRepository.get_page(). `list_version` is
+        the change counter the caller read in the same snapshot; the cached
+        first page is only reused at that exact version.
+        """
+        filtered = sort != DEFAULT_SORT or any(
+            value is not None for value in filters.values()
+        )
+        if filtered:
+            return await self._fetch_page(limit, cursor, sort, filters)
+
+        # Only the unfiltered first page is cached: it is what every client polls
+        if self.cache is not None and not cursor:
+            key = page_key(limit, list_version)
+            page = self.cache.get(key)
+            if page is None:
+                cache_version = self.cache.version
+                page = await self._fetch_page(limit, None)
+                self.cache.set(key, page, version=cache_version)
+            return page
+
+        return await self._fetch_page(limit, cursor)
+
+    async def _fetch_page(
+        self,
+        limit: int,
+        cursor: Optional[str],
+        sort: str = DEFAULT_SORT,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Task], Optional[str]]:
+        after = decode_cursor(cursor) if cursor else None
+        if filters is None:
+            tasks = await self.repository.get_page(limit=limit + 1, after=after)
+        else:
+            tasks = await self.repository.get_page(
+                limit=limit + 1, after=after, sort=sort, **filters
+            )
+
+        if len(tasks) <= limit:
+            return tasks, None
+
+        tasks = tasks[:limit]
+        last = tasks[-1]
+        return tasks, encode_cursor(getattr(last, sort.lstrip("-")), last.id)
+
+    async def search_tasks(
+        self, query: str, limit: int, cursor: Optional[str] = None
+    ) -> Tuple[List[Task], Optional[str]]:
+        """Full-text search returning one ranked page and the next-page cursor"""
+        after = decode_rank_cursor(cursor) if cursor else None
+        results = await self.repository.search(query, limit=limit + 1, after=after)
+
+        if len(results) <= limit:
+            return [task for task, _ in results], None
+
+        results = results[:limit]
+        last_task, last_rank = results[-1]
+        return (
+            [task for task, _ in results],
+            encode_rank_cursor(last_rank, last_task.id),
+        )
+
+    async def get_changes(
+        self,
+        limit: int,
+        token: Optional[str] = None,
+        settle: timedelta = timedelta(0),
+        retention: Optional[timedelta] = None,
+    ) -> Tuple[List[Task], List[UUID], str, bool]:
+        """
+        Tasks changed and ids deleted since `token`, plus the token to resume.
+
+        Without a token every task is returned (a full sync). Changed tasks
+        and tombstones are merged in (timestamp, id) order and `limit` of
+        them are returned at a time; while `has_more` is set the token
+        resumes exactly after the last one. Otherwise it is held
+        back to `settle` ago so writes from transactions that were still in
+        flight are picked up by the next sync; clients must apply changes
+        idempotently. Tokens older than `retention` raise
+        SyncTokenExpiredError because their tombstones may be compacted.
+        """
+        now = datetime.now(timezone.utc)
+        after = decode_cursor(token) if token else None
+        if after is not None and retention is not None and after[0] < now - retention:
+            raise SyncTokenExpiredError("Sync token expired, refetch all tasks")
+
+        tasks = await self.repository.get_page(
+            limit=limit + 1, after=after, sort="updated_at"
+        )
+        tombstones = (
+            await self.repository.get_tombstones(after, limit + 1) if after else []
+        )
+
+        # Each stream holds limit + 1 entries, enough for the merged page
+        changes = sorted(
+            [((task.updated_at, task.id), task) for task in tasks]
+            + [((deleted_at, task_id), task_id) for task_id, deleted_at in tombstones],
+            key=lambda change: change[0],
+        )
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        if has_more:
+            position = changes[-1][0]
+        else:
+            horizon = (now - settle, _MIN_UUID)
+            candidates = [after or horizon]
+            if changes:
+                candidates.append(changes[-1][0])
+            position = max(candidates)
+            if position > horizon:
+                position = max(horizon, after or horizon)
+
+        return (
+            [change for _, change in changes if isinstance(change, Task)],
+            [change for _, change in changes if not isinstance(change, Task)],
+            encode_cursor(*position),
+            has_more,
+        )
+
+    async def compact_tombstones(self, retention: timedelta) -> int:
+        """Drop tombstones older than the sync token retention period"""
+        return await self.repository.compact_tombstones(
+            datetime.now(timezone.utc) - retention
+        )
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Per-category task counts and estimated time from the summary table"""
+        rows = await self.repository.get_stats()
+        categories = [
+            {"category": category, "count": count, "total_estimated_time": total}
+            for category, count, total in rows
+        ]
+        return {
+            "categories": categories,
+            "total_count": sum(item["count"] for item in categories),
+            "total_estimated_time": sum(
+                item["total_estimated_time"] for item in categories
+            ),
+        }
+
     async def update_task(
         self,
         task_id: UUID,
         title: Optional[str] = None,
-        description: Optional[str] = None,
+        description: Optional[str] = UNSET,
         category: Optional[str] = None,
-        estimated_time: Optional[int] = None,
+        estimated_time: Optional[int] = UNSET,
     ) -> Optional[Task]:
-        """Update task with provided fields"""
-        return await self.repository.update(
+        """Update task with provided fields; None clears description/estimate"""
+        task = await self.repository.update(
             task_id=task_id,
             title=title,
             description=description,
             category=category,
             estimated_time=estimated_time,
         )
+        if task is not None:
+            await self._invalidate(str(task_id))
+        return task
+
+    async def apply_batch_operations(
+        self,
+        updates: List[
+            Tuple[UUID, Optional[str], Optional[str], Optional[str], Optional[int]]
+        ],
+        delete_ids: List[UUID],
+    ) -> Tuple[Dict[UUID, Task], Set[UUID]]:
+        """
+        Apply updates and deletes for many tasks in one transaction.
+
+        Returns updated tasks keyed by id and the set of deleted ids; ids
+        missing from both did not exist.
+        """
+        updated, deleted = await self.repository.apply_batch(updates, delete_ids)
+        if updated or deleted:
+            await self._invalidate(INVALIDATE_ALL)
+        return {task.id: task for task in updated}, deleted
 
     async def delete_task(self, task_id: UUID) -> bool:
         """Delete task, returns success status"""
-        return await self.repository.delete(task_id)
+        deleted = await self.repository.delete(task_id)
+        if deleted:
+            await self._invalidate(str(task_id))
+        return deleted
+
+    async def _invalidate(self, payload: str) -> None:
+        """
+        Invalidate this worker's coalesced reads and cache now.
+
+        Other workers catch up when the tasks triggers' task_events
+        notification reaches them, see cache.on_task_event_notify.
+        """
+        invalidate_flights(get_single_flight(), payload)
+        if self.cache is not None:
+            apply_invalidation(self.cache, payload)
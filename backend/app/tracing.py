@@ -0,0 +1,179 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+from uuid import UUID
+
+from backend.app.config import get_settings
+from backend.app.metrics import REGISTRY, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Label for SQL that is not one of the named repository statements
+DYNAMIC_STATEMENT = "dynamic"
+
+QUERY_SECONDS = REGISTRY.register(
+    Histogram(
+        "db_query_duration_seconds",
+        "Repository statement latency by statement name",
+        labelnames=("statement",),
+    )
+)
+OPERATION_SECONDS = REGISTRY.register(
+    Histogram(
+        "operation_duration_seconds",
+        "Latency of traced non-database operations",
+        labelnames=("operation",),
+    )
+)
+
+
+class Timing(NamedTuple):
+    """One traced statement or operation"""
+
+    name: str
+    duration: float
+    rows: int
+
+
+_hooks: List[Callable[[Timing], None]] = []
+
+
+def add_timing_hook(hook: Callable[[Timing], None]) -> None:
+    """Register a callback invoked with every Timing, e.g. for tracing"""
+    _hooks.append(hook)
+
+
+def remove_timing_hook(hook: Callable[[Timing], None]) -> None:
+    _hooks.remove(hook)
+
+
+def _emit(timing: Timing) -> None:
+    for hook in _hooks:
+        hook(timing)
+
+
+def redact(args: Sequence[Any]) -> str:
+    """Describe bound parameters by type and size without their values"""
+    parts = []
+    for position, value in enumerate(args, start=1):
+        if value is None:
+            description = "NULL"
+        elif isinstance(value, (str, bytes, list, tuple)):
+            description = f"{type(value).__name__}[{len(value)}]"
+        elif isinstance(value, UUID):
+            description = "uuid"
+        else:
+            description = type(value).__name__
+        parts.append(f"${position}={description}")
+    return ", ".join(parts)
+
+
+def _is_slow(duration: float) -> bool:
+    return duration * 1000 >= get_settings().slow_query_threshold_ms
+
+
+@contextmanager
+def trace_operation(name: str) -> Iterator[None]:
+    """Time a non-database operation such as categorization"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - started
+        OPERATION_SECONDS.observe(duration, operation=name)
+        _emit(Timing(name, duration, 0))
+        if _is_slow(duration):
+            logger.warning("Slow operation %s took %.1f ms", name, duration * 1000)
+
+
+def _row_count(status: Any) -> int:
+    """Rows affected according to a command status such as 'DELETE 3'"""
+    if isinstance(status, str):
+        count = status.rsplit(" ", 1)[-1]
+        if count.isdigit():
+            return int(count)
+    return 0
+
+
+class TimedConnection:
+    """
+    Connection proxy that times every statement a repository runs.
+
+    Each statement is recorded under its name from `statement_names` (SQL
+    text -> name), logged with redacted parameters when it exceeds
+    slow_query_threshold_ms and, with slow_query_explain enabled, followed
+    by an EXPLAIN (ANALYZE, BUFFERS) that is rolled back so writes are not
+    applied twice. Anything else (transactions, cursors) passes through.
+    """
+
+    __slots__ = ("_connection", "_statement_names")
+
+    def __init__(self, connection, statement_names: Dict[str, str]):
+        self._connection = connection
+        self._statement_names = statement_names
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    async def fetch(self, query: str, *args: Any, **kwargs: Any):
+        started = time.perf_counter()
+        rows = await self._connection.fetch(query, *args, **kwargs)
+        await self._record(query, args, started, len(rows))
+        return rows
+
+    async def fetchrow(self, query: str, *args: Any, **kwargs: Any):
+        started = time.perf_counter()
+        row = await self._connection.fetchrow(query, *args, **kwargs)
+        await self._record(query, args, started, 0 if row is None else 1)
+        return row
+
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any):
+        started = time.perf_counter()
+        value = await self._connection.fetchval(query, *args, **kwargs)
+        await self._record(query, args, started, 0 if value is None else 1)
+        return value
+
+    async def execute(self, query: str, *args: Any, **kwargs: Any):
+        started = time.perf_counter()
+        status = await self._connection.execute(query, *args, **kwargs)
+        await self._record(query, args, started, _row_count(status))
+        return status
+
+    async def _record(
+        self, query: str, args: Sequence[Any], started: float, rows: int
+    ) -> None:
+        duration = time.perf_counter() - started
+        name = self._statement_names.get(query, DYNAMIC_STATEMENT)
+        QUERY_SECONDS.observe(duration, statement=name)
+        _emit(Timing(name, duration, rows))
+
+        if not _is_slow(duration):
+            return
+        logger.warning(
+            "Slow query %s took %.1f ms, %d rows (%s)",
+            name,
+            duration * 1000,
+            rows,
+            redact(args),
+        )
+        if get_settings().slow_query_explain:
+            plan = await self._explain(query, args)
+            if plan is not None:
+                logger.warning("Plan for slow query %s:\n%s", name, plan)
+
+    async def _explain(self, query: str, args: Sequence[Any]) -> Optional[str]:
+        if query.lstrip().upper().startswith(("LOCK", "SELECT PG_NOTIFY")):
+            return None
+        transaction = self._connection.transaction()
+        await transaction.start()
+        try:
+            rows = await self._connection.fetch(
+                f"EXPLAIN (ANALYZE, BUFFERS) {query}", *args
+            )
+            return "\n".join(row[0] for row in rows)
+        except Exception:
+            logger.exception("EXPLAIN failed for slow query")
+            return None
+        finally:
+            await transaction.rollback()
@@ -0,0 +1,71 @@
+"""Store benchmark results as JSON baselines and compare runs against them."""
+
+import json
+import platform
+import subprocess
+import time
+from typing import Any, Dict, List, Mapping
+
+# Metric name -> whether a larger value is better
+HIGHER_IS_BETTER = {"rps": True, "ops_per_sec": True}
+
+
+def run_metadata(**params: Any) -> Dict[str, Any]:
+    """Describe where and how a run was made so baselines stay comparable"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "params": params,
+    }
+
+
+def save_baseline(path: str, results: Mapping[str, Mapping[str, float]], meta: Dict):
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(
+    current: Mapping[str, Mapping[str, float]],
+    baseline: Mapping[str, Mapping[str, float]],
+    metrics: List[str],
+    max_regression: float,
+) -> List[str]:
+    """
+    Describe every metric that regressed by more than `max_regression` percent.
+
+    Only benchmarks and metrics present in both runs are compared. Latency
+    style metrics regress when they grow, throughput metrics when they shrink.
+    """
+    regressions = []
+    for name in sorted(current.keys() & baseline.keys()):
+        for metric in metrics:
+            before = baseline[name].get(metric)
+            after = current[name].get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before * 100
+            if HIGHER_IS_BETTER.get(metric, False):
+                change = -change
+            if change > max_regression:
+                regressions.append(
+                    f"{name} {metric}: {before:.4g} -> {after:.4g} "
+                    f"({change:+.1f}% worse)"
+                )
+    return regressions
@@ -0,0 +1,150 @@
+"""
+Micro-benchmarks for per-task hot paths with a regression threshold mode.
+
+Covers categorization strategies, row mapping, Task.to_dict and JSON
+serialization over generated tasks with realistic title/description lengths.
+Earlier categorization implementations run alongside as `legacy_*` entries
+and the speedup of the current code over each is printed.
+Input is seeded and each result is the best of several repeats, so runs on
+the same machine are comparable across commits. Run from the repository root:
+
+    python -m backend.benchmarks.bench_hot_paths --save hot_paths.json
+    python -m backend.benchmarks.bench_hot_paths --compare hot_paths.json
+"""
+
+import argparse
+import sys
+import timeit
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from backend.app.models.task import Task
+from backend.app.repositories.task_repository import TaskRepository
+from backend.app.serialization import dumps
+from backend.app.services.categorization.strategies import (
+    KeywordStrategy,
+    PatternStrategy,
+)
+from backend.benchmarks.baseline import (
+    compare,
+    load_baseline,
+    run_metadata,
+    save_baseline,
+)
+from backend.benchmarks.data import make_task_inputs
+from backend.benchmarks.legacy_categorization import RegexMatcher, split_categorize
+
+COMPARED_METRICS = ["ns_per_item"]
+
+# (current, legacy) benchmark names reported as speedups
+SPEEDUPS = [
+    ("keyword_categorize", "legacy_split_categorize"),
+    ("keyword_categorize", "legacy_regex_categorize"),
+    ("keyword_categorize_many", "legacy_split_categorize"),
+]
+
+
+def make_rows(inputs: List[Dict]) -> List[tuple]:
+    """Rows shaped like asyncpg records: task columns in _TASK_COLUMNS order"""
+    now = datetime.now(timezone.utc)
+    return [
+        (
+            uuid4(),
+            item["title"],
+            item["description"],
+            "personal",
+            item["estimated_time"],
+            now,
+            now,
+        )
+        for item in inputs
+    ]
+
+
+def build_benchmarks(batch_size: int) -> List[Tuple[str, Callable[[], object]]]:
+    """(name, callable processing one batch) pairs for a given batch size"""
+    inputs = make_task_inputs(batch_size, seed=batch_size)
+    pairs = [(item["title"], item["description"]) for item in inputs]
+    rows = make_rows(inputs)
+    tasks = [TaskRepository._row_to_task(row) for row in rows]
+    keyword = KeywordStrategy()
+    pattern = PatternStrategy()
+    regex = RegexMatcher(KeywordStrategy.RULES, default="personal")
+
+    return [
+        ("keyword_categorize", lambda: [keyword.categorize(*p) for p in pairs]),
+        ("pattern_categorize", lambda: [pattern.categorize(*p) for p in pairs]),
+        ("keyword_categorize_many", lambda: keyword.categorize_many(pairs)),
+        ("legacy_split_categorize", lambda: [split_categorize(*p) for p in pairs]),
+        ("legacy_regex_categorize", lambda: [regex.match(*p) for p in pairs]),
+        ("row_to_task", lambda: list(map(TaskRepository._row_to_task, rows))),
+        ("task_to_dict", lambda: [Task.to_dict(task) for task in tasks]),
+        ("serialize_tasks", lambda: dumps(tasks)),
+    ]
+
+
+def run(batch_sizes: List[int], repeat: int, min_time: float) -> Dict:
+    results = {}
+    for batch_size in batch_sizes:
+        for name, func in build_benchmarks(batch_size):
+            timer = timeit.Timer(func)
+            number, _ = timer.autorange()
+            number = max(1, int(number * min_time / 0.2))
+            best = min(timer.repeat(repeat=repeat, number=number)) / number
+            per_item = best / batch_size
+            results[f"{name}[{batch_size}]"] = {
+                "ns_per_item": per_item * 1e9,
+                "ops_per_sec": 1 / per_item,
+            }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--batch-sizes",
+        default="1,100,10000",
+        help="comma-separated numbers of tasks per call",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="seconds per timing repeat"
+    )
+    parser.add_argument("--save", metavar="PATH", help="write results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="baseline to compare to")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=15.0,
+        help="percent slowdown per item tolerated by --compare",
+    )
+    args = parser.parse_args()
+
+    batch_sizes = [int(size) for size in args.batch_sizes.split(",")]
+    results = run(batch_sizes, args.repeat, args.min_time)
+    for name, row in results.items():
+        print(f"{name:>32}: {row['ns_per_item']:10.1f} ns/item")
+    for batch_size in batch_sizes:
+        for current, legacy in SPEEDUPS:
+            ratio = (
+                results[f"{legacy}[{batch_size}]"]["ns_per_item"]
+                / results[f"{current}[{batch_size}]"]["ns_per_item"]
+            )
+            print(f"{current} vs {legacy} [{batch_size}]: {ratio:.2f}x")
+
+    if args.save:
+        params = {"batch_sizes": batch_sizes, "repeat": args.repeat}
+        save_baseline(args.save, results, run_metadata(**params))
+    if args.compare:
+        regressions = compare(
+            results, load_baseline(args.compare), COMPARED_METRICS, args.max_regression
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
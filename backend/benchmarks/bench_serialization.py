@@ -0,0 +1,73 @@
+"""
+Compare task list serialization paths.
+
+Run from the repository root:
+
+    python -m backend.benchmarks.bench_serialization --tasks 10000
+"""
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timezone
+from typing import List
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from backend.app.models.task import Task
+from backend.app.schemas.task import TaskResponse
+from backend.app.serialization import dumps
+
+
+def make_tasks(count: int) -> List[Task]:
+    now = datetime.now(timezone.utc)
+    return [
+        Task(
+            id=uuid4(),
+            title=f"Prepare report {i}",
+            description="Collect figures and send the summary to the client",
+            category="work",
+            estimated_time=60,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+_adapter = TypeAdapter(List[TaskResponse])
+
+
+def serialize_via_response_model(tasks: List[Task]) -> bytes:
+    """Previous path: to_dict(), response_model validation, then json.dumps"""
+    validated = _adapter.validate_python([task.to_dict() for task in tasks])
+    return json.dumps(_adapter.dump_python(validated, mode="json")).encode()
+
+
+def serialize_direct(tasks: List[Task]) -> bytes:
+    """Fast path: encode Task objects straight to JSON bytes"""
+    return dumps(tasks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.tasks)
+    results = {}
+    for name, func in (
+        ("response_model", serialize_via_response_model),
+        ("direct", serialize_direct),
+    ):
+        best = min(timeit.repeat(lambda: func(tasks), number=1, repeat=args.repeat))
+        results[name] = best
+        print(f"{name:>15}: {best * 1000:8.2f} ms per {args.tasks} tasks")
+
+    print(f"{'speedup':>15}: {results['response_model'] / results['direct']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
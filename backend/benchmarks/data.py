@@ -0,0 +1,93 @@
+"""Synthetic task content shared by the benchmarks."""
+
+import random
+from typing import Dict, List, Optional
+
+_VERBS = (
+    "Prepare",
+    "Review",
+    "Call",
+    "Buy",
+    "Fix",
+    "Schedule",
+    "Send",
+    "Clean",
+    "Update",
+    "Book",
+    "Finish",
+    "Plan",
+    "Pay",
+    "Organize",
+    "Deploy",
+)
+_OBJECTS = (
+    "quarterly report",
+    "dentist appointment",
+    "groceries",
+    "production bug",
+    "team meeting",
+    "invoice",
+    "client presentation",
+    "garage",
+    "budget",
+    "birthday party",
+    "server migration",
+    "flight tickets",
+    "tax return",
+    "project proposal",
+    "gym membership",
+)
+_QUALIFIERS = (
+    "",
+    "",
+    "",
+    "asap",
+    "today",
+    "for Monday",
+    "before the deadline",
+    "with the team",
+    "URGENT",
+    "!!",
+    "this weekend",
+    "after lunch",
+)
+_SENTENCES = (
+    "Collect the latest figures and send the summary to the client.",
+    "Remember to bring the documents from last week.",
+    "The meeting room is booked from two to three.",
+    "Check with the family before confirming the date.",
+    "Critical issue reported by several customers overnight.",
+    "Compare prices at two shops before buying anything.",
+    "Follow up with the vendor if there is no reply by Friday.",
+    "Keep the receipts for the expense report.",
+    "Coordinate with operations so the deployment window is clear.",
+    "Nothing urgent, but it has been on the list for a while.",
+)
+
+
+def make_title(rng: random.Random) -> str:
+    """Titles of roughly 10-60 characters, like the ones users type"""
+    title = f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)}"
+    qualifier = rng.choice(_QUALIFIERS)
+    return f"{title} {qualifier}" if qualifier else title
+
+
+def make_description(rng: random.Random) -> Optional[str]:
+    """No description a third of the time, otherwise one to eight sentences"""
+    if rng.random() < 0.33:
+        return None
+    count = min(8, max(1, int(rng.expovariate(1 / 2.5))))
+    return " ".join(rng.choice(_SENTENCES) for _ in range(count))
+
+
+def make_task_inputs(count: int, seed: int = 0) -> List[Dict]:
+    """Create payloads (title, description, estimated_time) for `count` tasks"""
+    rng = random.Random(seed)
+    return [
+        {
+            "title": make_title(rng),
+            "description": make_description(rng),
+            "estimated_time": rng.choice((None, 15, 30, 45, 60, 90, 120, 240)),
+        }
+        for _ in range(count)
+    ]
@@ -0,0 +1,50 @@
+"""
+Earlier keyword categorization implementations, kept as benchmark references.
+
+`split_categorize` is the original whitespace-split/set-intersection code
+(no punctuation handling); `RegexMatcher` is the single alternation regex
+that replaced it. bench_hot_paths times both against the current matcher.
+"""
+
+import re
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from backend.app.services.categorization.strategies import KeywordStrategy
+
+
+def split_categorize(title: str, description: Optional[str]) -> str:
+    words = set(f"{title} {description or ''}".lower().split())
+    for category, keywords in KeywordStrategy.RULES:
+        if words & keywords:
+            return category
+    return "personal"
+
+
+class RegexMatcher:
+    def __init__(self, rules: Sequence[Tuple[str, Iterable[str]]], default: str):
+        self.default = default
+        self._categories = [category for category, _ in rules]
+        self._priorities: Dict[str, int] = {}
+        for priority, (_, keywords) in enumerate(rules):
+            for keyword in keywords:
+                self._priorities.setdefault(keyword.lower(), priority)
+        alternatives = sorted(self._priorities, key=len, reverse=True)
+        self._pattern = re.compile(
+            r"\b(?:" + "|".join(map(re.escape, alternatives)) + r")\b",
+            re.IGNORECASE,
+        )
+
+    def _best_priority(self, text: str, best: int) -> int:
+        for match in self._pattern.finditer(text):
+            priority = self._priorities[match.group(0).lower()]
+            if priority < best:
+                best = priority
+                if best == 0:
+                    break
+        return best
+
+    def match(self, title: str, description: Optional[str]) -> str:
+        best = self._best_priority(title, len(self._categories))
+        if description and best > 0:
+            best = self._best_priority(description, best)
+        return self._categories[best] if best < len(self._categories) else self.default
@@ -0,0 +1,262 @@
+"""
+HTTP load test for the task API with JSON baselines.
+
+Starts the API with uvicorn (or targets --url), seeds tasks, then drives a
+weighted mix of create/list/get/update/delete requests at a fixed
+concurrency and reports RPS and p50/p95/p99 latency per endpoint. Needs a
+migrated Postgres reachable through DATABASE_URL. Run from the repository
+root:
+
+    python -m backend.benchmarks.load_test --seed 10000 --concurrency 50
+    python -m backend.benchmarks.load_test --save baseline.json
+    python -m backend.benchmarks.load_test --compare baseline.json
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import httpx
+
+from backend.benchmarks.baseline import (
+    compare,
+    load_baseline,
+    run_metadata,
+    save_baseline,
+)
+from backend.benchmarks.data import make_task_inputs
+
+DEFAULT_MIX = "create=1,list=4,get=4,update=2,delete=1"
+SEED_BATCH_SIZE = 500
+COMPARED_METRICS = ["p50_ms", "p95_ms", "p99_ms", "rps"]
+
+# Each operation is a LoadTest method of the same name
+OPERATIONS = ("create", "list", "get", "update", "delete")
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation in mix: {name}")
+        weights[name] = float(weight)
+    return weights
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+class LoadTest:
+    """Shared state for one run: known task ids and per-operation latencies"""
+
+    def __init__(self, client: httpx.AsyncClient, rng: random.Random):
+        self.client = client
+        self.rng = rng
+        self.task_ids: List[str] = []
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.payloads = make_task_inputs(1000, seed=rng.randrange(1 << 30))
+
+    async def seed(self, count: int) -> None:
+        for start in range(0, count, SEED_BATCH_SIZE):
+            batch = make_task_inputs(min(SEED_BATCH_SIZE, count - start), seed=start)
+            response = await self.client.post("/api/tasks/batch", json=batch)
+            response.raise_for_status()
+            self.task_ids.extend(task["id"] for task in response.json())
+
+    def _random_id(self) -> Optional[str]:
+        return self.rng.choice(self.task_ids) if self.task_ids else None
+
+    async def create(self) -> httpx.Response:
+        response = await self.client.post(
+            "/api/tasks", json=self.rng.choice(self.payloads)
+        )
+        if response.status_code == 201:
+            self.task_ids.append(response.json()["id"])
+        return response
+
+    async def list(self) -> httpx.Response:
+        return await self.client.get("/api/tasks", params={"limit": 50})
+
+    async def get(self) -> Optional[httpx.Response]:
+        task_id = self._random_id()
+        return await self.client.get(f"/api/tasks/{task_id}") if task_id else None
+
+    async def update(self) -> Optional[httpx.Response]:
+        task_id = self._random_id()
+        if task_id is None:
+            return None
+        body = {"estimated_time": self.rng.choice((15, 30, 60, 120))}
+        return await self.client.put(f"/api/tasks/{task_id}", json=body)
+
+    async def delete(self) -> Optional[httpx.Response]:
+        if not self.task_ids:
+            return None
+        # Swap-remove so concurrent workers never delete the same id twice
+        index = self.rng.randrange(len(self.task_ids))
+        self.task_ids[index], self.task_ids[-1] = (
+            self.task_ids[-1],
+            self.task_ids[index],
+        )
+        return await self.client.delete(f"/api/tasks/{self.task_ids.pop()}")
+
+    async def worker(self, weights: Dict[str, float], deadline: float, record_after):
+        names = list(weights)
+        weight_values = list(weights.values())
+        while time.perf_counter() < deadline:
+            name = self.rng.choices(names, weight_values)[0]
+            started = time.perf_counter()
+            try:
+                response = await getattr(self, name)()
+            except httpx.HTTPError:
+                if started >= record_after:
+                    self.errors[name] += 1
+                continue
+            elapsed = time.perf_counter() - started
+            if response is None or started < record_after:
+                continue
+            self.latencies[name].append(elapsed)
+            if response.status_code >= 400:
+                self.errors[name] += 1
+
+    def report(self, duration: float) -> Dict[str, Dict[str, float]]:
+        results = {}
+        for name, values in sorted(self.latencies.items()):
+            values.sort()
+            results[name] = {
+                "requests": len(values),
+                "errors": self.errors[name],
+                "rps": len(values) / duration,
+                "p50_ms": percentile(values, 0.50) * 1000,
+                "p95_ms": percentile(values, 0.95) * 1000,
+                "p99_ms": percentile(values, 0.99) * 1000,
+            }
+        return results
+
+
+def start_server(port: int, workers: int) -> subprocess.Popen:
+    command = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "backend.app.main:app",
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+        "--no-access-log",
+    ]
+    return subprocess.Popen(command, env=os.environ.copy())
+
+
+async def wait_until_healthy(client: httpx.AsyncClient, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            if (await client.get("/api/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        if time.perf_counter() > deadline:
+            raise RuntimeError("API did not become healthy in time")
+        await asyncio.sleep(0.2)
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    weights = parse_mix(args.mix)
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.url, limits=limits, timeout=args.timeout
+    ) as client:
+        await wait_until_healthy(client, timeout=30)
+        test = LoadTest(client, random.Random(args.random_seed))
+        await test.seed(args.seed)
+
+        started = time.perf_counter()
+        record_after = started + args.warmup
+        deadline = record_after + args.duration
+        await asyncio.gather(
+            *(
+                test.worker(weights, deadline, record_after)
+                for _ in range(args.concurrency)
+            )
+        )
+        return test.report(args.duration)
+
+
+def print_report(results: Dict[str, Dict[str, float]]) -> None:
+    print(
+        f"{'endpoint':>10} {'requests':>9} {'errors':>7} {'rps':>9} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    for name, row in results.items():
+        print(
+            f"{name:>10} {row['requests']:>9} {row['errors']:>7} "
+            f"{row['rps']:>9.1f} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} "
+            f"{row['p99_ms']:>8.2f}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="target a running API instead of starting one")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=1000, help="tasks to create")
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--random-seed", type=int, default=0)
+    parser.add_argument("--save", metavar="PATH", help="write results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="baseline to compare to")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=10.0,
+        help="percent change tolerated by --compare",
+    )
+    args = parser.parse_args()
+
+    server = None
+    if args.url is None:
+        args.url = f"http://127.0.0.1:{args.port}"
+        server = start_server(args.port, args.workers)
+    try:
+        results = asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print_report(results)
+    if args.save:
+        params = {
+            key: getattr(args, key)
+            for key in ("seed", "mix", "concurrency", "duration", "workers")
+        }
+        save_baseline(args.save, results, run_metadata(**params))
+    if args.compare:
+        regressions = compare(
+            results, load_baseline(args.compare), COMPARED_METRICS, args.max_regression
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
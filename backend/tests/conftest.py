@@ -1,5 +1,6 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from collections import namedtuple
+from unittest.mock import AsyncMock
 from datetime import datetime
 from uuid import uuid4
 
@@ -27,10 +28,5 @@ def sample_task_data():
 
 @pytest.fixture
 def sample_task_row(sample_task_data):
-    """Fixture providing sample database row"""
-    row = MagicMock()
-    for key, value in sample_task_data.items():
-        row.__getitem__.return_value = value
-        setattr(row, key, value)
-        row.__getitem__.side_effect = lambda k: sample_task_data.get(k)
-    return row
+    """Fixture providing sample database row, columns in _TASK_COLUMNS order"""
+    return namedtuple("TaskRow", sample_task_data)(**sample_task_data)
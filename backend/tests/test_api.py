@@ -1,9 +1,20 @@
+import json
 import pytest
 from httpx import AsyncClient
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 from backend.app.main import app
-from datetime import datetime
+from backend.app.etag import task_etag
+from backend.app.services.pagination import encode_cursor
+from datetime import datetime, timezone
+
+
+class MockTransaction:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *args):
+        pass
 
 
 @pytest.mark.asyncio
@@ -42,15 +53,15 @@ async def test_create_task_with_malicious_input():
     task_id = uuid4()
 
     mock_connection.fetchrow = AsyncMock(
-        return_value={
-            "id": task_id,
-            "title": "Test task",
-            "description": "Safe description",
-            "category": "work",
-            "estimated_time": 60,
-            "created_at": datetime.now(),
-            "updated_at": datetime.now(),
-        }
+        return_value=(
+            task_id,
+            "Test task",
+            "Safe description",
+            "work",
+            60,
+            datetime.now(),
+            datetime.now(),
+        )
     )
 
     class MockAcquireContext:
@@ -96,3 +107,412 @@ async def test_get_nonexistent_task():
         async with AsyncClient(app=app, base_url="http://test") as client:
             response = await client.get(f"/api/tasks/{uuid4()}")
             assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_invalid_cursor():
+    """Test API: malformed pagination cursor is rejected"""
+    mock_connection = AsyncMock()
+    mock_connection.fetchval = AsyncMock(return_value=1)
+    mock_connection.transaction = MagicMock(return_value=MockTransaction())
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return mock_connection
+
+        async def __aexit__(self, *args):
+            pass
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get("/api/tasks", params={"cursor": "not-a-cursor"})
+            assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_stream_ndjson():
+    """Test API: streaming mode emits one JSON document per line"""
+    rows = [
+        (
+            uuid4(),
+            f"Task {i}",
+            None,
+            "personal",
+            None,
+            datetime.now(),
+            datetime.now(),
+        )
+        for i in range(3)
+    ]
+
+    class MockCursor:
+        def __aiter__(self):
+            return self._iterate()
+
+        async def _iterate(self):
+            for row in rows:
+                yield row
+
+    mock_connection = AsyncMock()
+    mock_connection.transaction = MagicMock(return_value=MockTransaction())
+    mock_connection.cursor = MagicMock(return_value=MockCursor())
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return mock_connection
+
+        async def __aexit__(self, *args):
+            pass
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get(
+                "/api/tasks", headers={"Accept": "application/x-ndjson"}
+            )
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            lines = response.text.strip().split("\n")
+            assert [json.loads(line)["title"] for line in lines] == [
+                "Task 0",
+                "Task 1",
+                "Task 2",
+            ]
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_ndjson_refused_with_q_zero():
+    """Test API: an NDJSON type sent with q=0 gets a normal JSON page"""
+    mock_connection = AsyncMock()
+    mock_connection.fetchval = AsyncMock(return_value=1)
+    mock_connection.fetch = AsyncMock(return_value=[])
+    mock_connection.transaction = MagicMock(return_value=MockTransaction())
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return mock_connection
+
+        async def __aexit__(self, *args):
+            pass
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get(
+                "/api/tasks",
+                headers={"Accept": "application/json, application/x-ndjson;q=0"},
+            )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_create_tasks_batch_too_large():
+    """Test API: batch creation rejects oversized batches"""
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return AsyncMock()
+
+        async def __aexit__(self, *args):
+            pass
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+        with patch("backend.app.routes.tasks.get_settings") as mock_settings:
+            mock_settings.return_value.tasks_batch_max_size = 1
+
+            async with AsyncClient(app=app, base_url="http://test") as client:
+                response = await client.post(
+                    "/api/tasks/batch",
+                    json=[{"title": "One"}, {"title": "Two"}],
+                )
+                assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_batch_operations_report_per_item_status():
+    """Test API: batch operations report the outcome of each item"""
+    updated_id, deleted_id, missing_id = uuid4(), uuid4(), uuid4()
+
+    class MockTransaction:
+        async def __aenter__(self):
+            return None
+
+        async def __aexit__(self, *args):
+            pass
+
+    mock_connection = AsyncMock()
+    mock_connection.transaction = MagicMock(return_value=MockTransaction())
+    mock_connection.fetch = AsyncMock(
+        side_effect=[
+            [
+                (
+                    updated_id,
+                    "Renamed",
+                    None,
+                    "work",
+                    None,
+                    datetime.now(),
+                    datetime.now(),
+                )
+            ],
+            [{"id": deleted_id}],
+        ]
+    )
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return mock_connection
+
+        async def __aexit__(self, *args):
+            pass
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.post(
+                "/api/tasks/batch-ops",
+                json=[
+                    {"op": "update", "id": str(updated_id), "title": "Renamed"},
+                    {"op": "delete", "id": str(deleted_id)},
+                    {"op": "delete", "id": str(missing_id)},
+                ],
+            )
+            assert response.status_code == 200
+            assert [item["status"] for item in response.json()] == [
+                "updated",
+                "deleted",
+                "not_found",
+            ]
+
+
+@pytest.mark.asyncio
+async def test_batch_operations_reject_empty_update():
+    """Test API: an update operation that changes nothing is rejected"""
+    mock_connection = AsyncMock()
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return mock_connection
+
+        async def __aexit__(self, *args):
+            pass
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.post(
+                "/api/tasks/batch-ops",
+                json=[
+                    {"op": "update", "id": str(uuid4()), "title": "Renamed"},
+                    {"op": "update", "id": str(uuid4())},
+                ],
+            )
+
+    assert response.status_code == 422
+    mock_connection.fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_task_not_modified():
+    """Test API: matching If-None-Match returns 304 without fetching the row"""
+    task_id = uuid4()
+    updated_at = datetime.now()
+    mock_connection = AsyncMock()
+    mock_connection.fetchval = AsyncMock(return_value=updated_at)
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return mock_connection
+
+        async def __aexit__(self, *args):
+            pass
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get(
+                f"/api/tasks/{task_id}",
+                headers={"If-None-Match": task_etag(task_id, updated_at)},
+            )
+            assert response.status_code == 304
+            assert response.content == b""
+            mock_connection.fetchrow.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_etag_round_trip():
+    """Test API: list ETag is returned and honored while the version is unchanged"""
+    mock_connection = AsyncMock()
+    mock_connection.fetchval = AsyncMock(return_value=7)
+    mock_connection.fetch = AsyncMock(return_value=[])
+    mock_connection.transaction = MagicMock(return_value=MockTransaction())
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return mock_connection
+
+        async def __aexit__(self, *args):
+            pass
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            first = await client.get("/api/tasks")
+            assert first.status_code == 200
+            etag = first.headers["etag"]
+
+            second = await client.get("/api/tasks", headers={"If-None-Match": etag})
+            assert second.status_code == 304
+            mock_connection.fetch.assert_called_once()
+
+            mock_connection.fetchval.return_value = 8
+            third = await client.get("/api/tasks", headers={"If-None-Match": etag})
+            assert third.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_etag_matches_the_served_page():
+    """Test API: plain reads skip the version check; ETags follow the snapshot"""
+    mock_connection = AsyncMock()
+    # Plain read: snapshot 8. Stale revalidation: check sees 7, snapshot 8.
+    # Current revalidation: check sees 8.
+    mock_connection.fetchval = AsyncMock(side_effect=[8, 7, 8, 8])
+    mock_connection.fetch = AsyncMock(return_value=[])
+    mock_connection.transaction = MagicMock(return_value=MockTransaction())
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return mock_connection
+
+        async def __aexit__(self, *args):
+            pass
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            first = await client.get("/api/tasks")
+            assert mock_connection.fetchval.await_count == 1
+            assert mock_pool.return_value.acquire.call_count == 1
+
+            stale = await client.get("/api/tasks", headers={"If-None-Match": '"old"'})
+            current = await client.get(
+                "/api/tasks", headers={"If-None-Match": first.headers["etag"]}
+            )
+
+    assert first.status_code == 200
+    assert stale.status_code == 200
+    assert stale.headers["etag"] == first.headers["etag"]
+    assert current.status_code == 304
+    mock_connection.transaction.assert_called_with(
+        isolation="repeatable_read", readonly=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_tasks():
+    """Test API: search route returns ranked matches, not a task lookup"""
+    mock_connection = AsyncMock()
+    mock_connection.fetch = AsyncMock(
+        return_value=[
+            (
+                uuid4(),
+                "Quarterly report",
+                None,
+                "work",
+                None,
+                datetime.now(),
+                datetime.now(),
+                0.6,
+            )
+        ]
+    )
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return mock_connection
+
+        async def __aexit__(self, *args):
+            pass
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get("/api/tasks/search", params={"q": "report"})
+            assert response.status_code == 200
+            body = response.json()
+            assert [item["title"] for item in body["items"]] == ["Quarterly report"]
+            assert body["next_cursor"] is None
+            assert "rank" not in body["items"][0]
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_rejects_unknown_sort():
+    """Test API: only indexed sort keys are accepted"""
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return AsyncMock()
+
+        async def __aexit__(self, *args):
+            pass
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get("/api/tasks", params={"sort": "title"})
+            assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_task_changes_expired_token():
+    """Test API: sync token older than tombstone retention returns 410"""
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return AsyncMock()
+
+        async def __aexit__(self, *args):
+            pass
+
+    since = encode_cursor(datetime(2000, 1, 1, tzinfo=timezone.utc), uuid4())
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get("/api/tasks/changes", params={"since": since})
+            assert response.status_code == 410
+
+
+@pytest.mark.asyncio
+async def test_get_task_changes_naive_token():
+    """Test API: a sync token without a UTC offset is rejected, not a 500"""
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return AsyncMock()
+
+        async def __aexit__(self, *args):
+            pass
+
+    since = encode_cursor(datetime(2026, 10, 18), uuid4())
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get("/api/tasks/changes", params={"since": since})
+            assert response.status_code == 400
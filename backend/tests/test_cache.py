@@ -0,0 +1,95 @@
+from backend.app.services import cache as cache_module
+from backend.app.services import coalescing
+from backend.app.services.cache import (
+    INVALIDATE_PAGES,
+    TTLCache,
+    apply_invalidation,
+    on_task_event_notify,
+    page_key,
+    task_key,
+)
+from backend.app.services.coalescing import SingleFlight, task_flight_key
+
+
+def test_cache_hit_and_miss_counters():
+    """Test cache: hits and misses are counted"""
+    cache = TTLCache(max_size=10, ttl=60)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_evicts_least_recently_used():
+    """Test cache: oldest unused entry is evicted past max_size"""
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_entries_expire(monkeypatch):
+    """Test cache: entries expire after ttl"""
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = TTLCache(max_size=10, ttl=5)
+    cache.set("a", 1)
+
+    now[0] += 6
+    assert cache.get("a") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_skips_stale_set_after_invalidation():
+    """Test cache: value read before a write landed is not stored"""
+    cache = TTLCache(max_size=10, ttl=60)
+    version = cache.version
+    cache.invalidate("a")
+    cache.set("a", "stale", version=version)
+
+    assert cache.get("a") is None
+
+
+def test_apply_invalidation_payloads():
+    """Test cache: task-id payloads drop the task and all list pages"""
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set(task_key("t1"), "task 1")
+    cache.set(task_key("t2"), "task 2")
+    cache.set(page_key(50), "page")
+
+    apply_invalidation(cache, INVALIDATE_PAGES)
+    assert cache.get(page_key(50)) is None
+    assert cache.get(task_key("t1")) == "task 1"
+
+    apply_invalidation(cache, "t1")
+    assert cache.get(task_key("t1")) is None
+    assert cache.get(task_key("t2")) == "task 2"
+
+
+def test_task_events_invalidate_other_workers(monkeypatch):
+    """Test cache: task_events notifications evict what the write changed"""
+    cache = TTLCache(max_size=10, ttl=60)
+    flights = SingleFlight()
+    monkeypatch.setattr(cache_module, "get_task_cache", lambda: cache)
+    monkeypatch.setattr(coalescing, "get_single_flight", lambda: flights)
+    cache.set(task_key("t1"), "task 1")
+    cache.set(task_key("t2"), "task 2")
+    cache.set(page_key(50), "page")
+    flights._flights = {
+        key: None for key in [task_flight_key("t1"), task_flight_key("t2"), ("page",)]
+    }
+
+    on_task_event_notify(None, 1, "task_events", '{"type": "created", "ids": ["t3"]}')
+    assert cache.get(page_key(50)) is None
+    assert list(flights._flights) == [task_flight_key("t1"), task_flight_key("t2")]
+
+    on_task_event_notify(None, 1, "task_events", '{"type": "updated", "ids": ["t1"]}')
+    assert cache.get(task_key("t1")) is None
+    assert cache.get(task_key("t2")) == "task 2"
+    assert list(flights._flights) == [task_flight_key("t2")]
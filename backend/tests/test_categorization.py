@@ -1,5 +1,25 @@
-from backend.app.services.categorization.strategies import KeywordStrategy, PatternStrategy
+from backend.app.services.categorization.strategies import (
+    KeywordMatcher,
+    KeywordStrategy,
+    PatternStrategy,
+)
 from backend.app.services.categorization.factory import CategorizerFactory
+from backend.app.config import get_settings
+import json
+import pytest
+
+
+@pytest.fixture
+def isolated_factory(monkeypatch):
+    """Fixture giving each test its own CategorizerFactory registry state"""
+    monkeypatch.setattr(
+        CategorizerFactory, "_strategies", dict(CategorizerFactory._strategies)
+    )
+    monkeypatch.setattr(CategorizerFactory, "_instances", {})
+    monkeypatch.setattr(CategorizerFactory, "_keyword_rules", None)
+    monkeypatch.setattr(CategorizerFactory, "_keywords_mtime", None)
+    monkeypatch.setattr(CategorizerFactory, "_next_reload_check", 0.0)
+    return CategorizerFactory
 
 
 def test_keyword_strategy_categorizes_urgent():
@@ -53,3 +73,140 @@ def test_factory_defaults_to_keyword():
     """Test Factory default strategy"""
     categorizer = CategorizerFactory.create_categorizer("unknown")
     assert isinstance(categorizer, KeywordStrategy)
+
+
+def test_keyword_strategy_ignores_punctuation():
+    """Test keywords match as whole words next to punctuation"""
+    strategy = KeywordStrategy()
+    result = strategy.categorize("Meeting, then lunch", None)
+    assert result == "work"
+
+
+def test_keyword_strategy_urgent_beats_work():
+    """Test category priority regardless of keyword order in text"""
+    strategy = KeywordStrategy()
+    result = strategy.categorize("Client report", "Needed asap")
+    assert result == "urgent"
+
+
+def test_pattern_strategy_matches_whole_words_only():
+    """Test short time-sensitive words do not match inside other words"""
+    strategy = PatternStrategy()
+    result = strategy.categorize("Walk in the nearby park", None)
+    assert result == "personal"
+
+
+def test_pattern_strategy_detects_time_sensitive_words():
+    """Test time-sensitive words categorize as work"""
+    strategy = PatternStrategy()
+    result = strategy.categorize("Finish slides by Friday", None)
+    assert result == "work"
+
+
+@pytest.mark.parametrize("strategy_class", [KeywordStrategy, PatternStrategy])
+def test_categorize_many_matches_single_calls(strategy_class):
+    """Test batch categorization agrees with per-item categorization"""
+    strategy = strategy_class()
+    items = [
+        ("URGENT: Fix production bug", "Critical issue"),
+        ("Schedule meeting with client", None),
+        ("Buy groceries", "Shopping list"),
+        ("Random task", None),
+        ("Pay rent!!", "Due by Friday"),
+        ("Odd\0title", "Call the client"),
+    ]
+    assert strategy.categorize_many(items) == [
+        strategy.categorize(title, description) for title, description in items
+    ]
+
+
+@pytest.mark.parametrize("separator", ["\xa0", "\u2003", "\u3000", "\x1f"])
+def test_keywords_split_on_unicode_whitespace(separator):
+    """Test non-ASCII whitespace separates words, as str.split() does"""
+    strategy = KeywordStrategy()
+    title = f"urgent{separator}meeting"
+    assert strategy.categorize(title, None) == "urgent"
+    assert strategy.categorize_many([(title, None), ("Buy milk", None)]) == [
+        "urgent",
+        "personal",
+    ]
+
+
+def test_keyword_matcher_uses_rule_priority():
+    """Test matcher picks the earliest rule with a matching keyword"""
+    matcher = KeywordMatcher(
+        [("first", {"alpha"}), ("second", {"beta", "alpha"})], default="none"
+    )
+    assert matcher.match("beta then alpha", None) == "first"
+    assert matcher.match("beta", None) == "second"
+    assert matcher.match("alphabet", None) == "none"
+
+
+def test_factory_reuses_shared_instance(isolated_factory):
+    """Test Factory registry returns the same long-lived instance"""
+    first = isolated_factory.create_categorizer("keyword")
+    second = isolated_factory.create_categorizer("keyword")
+    assert first is second
+
+
+def test_factory_registers_custom_strategy(isolated_factory):
+    """Test Factory registry accepts new strategies"""
+
+    class AlwaysWork(KeywordStrategy):
+        def categorize(self, title, description):
+            return "work"
+
+    isolated_factory.register("always-work", AlwaysWork)
+    categorizer = isolated_factory.create_categorizer("always-work")
+    assert categorizer.categorize("Buy milk", None) == "work"
+
+
+def test_factory_hot_reloads_keywords_file(isolated_factory, tmp_path, monkeypatch):
+    """Test keyword rules are reloaded from the configured file"""
+    keywords_file = tmp_path / "keywords.json"
+    keywords_file.write_text(json.dumps({"urgent": ["groceries"], "work": []}))
+    settings = get_settings()
+    monkeypatch.setattr(settings, "categorization_strategy", "keyword")
+    monkeypatch.setattr(settings, "categorization_keywords_file", str(keywords_file))
+
+    categorizer = isolated_factory.get_categorizer()
+    assert categorizer.categorize("Buy groceries", None) == "urgent"
+
+    keywords_file.write_text(json.dumps({"work": ["groceries"]}))
+    isolated_factory._keywords_mtime = None
+    isolated_factory._next_reload_check = 0.0
+    assert isolated_factory.get_categorizer() is categorizer
+    assert categorizer.categorize("Buy groceries", None) == "work"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '{"urgent": ["groc',
+        '{"urgent": [], "work": []}',
+        '["groceries"]',
+        '{"errands": ["groceries"]}',
+    ],
+)
+def test_factory_keeps_rules_when_keywords_file_is_invalid(
+    isolated_factory, tmp_path, monkeypatch, content
+):
+    """Test a malformed, empty or unknown-category file keeps the current rules"""
+    keywords_file = tmp_path / "keywords.json"
+    keywords_file.write_text(json.dumps({"urgent": ["groceries"]}))
+    settings = get_settings()
+    monkeypatch.setattr(settings, "categorization_strategy", "keyword")
+    monkeypatch.setattr(settings, "categorization_keywords_file", str(keywords_file))
+    categorizer = isolated_factory.get_categorizer()
+
+    keywords_file.write_text(content)
+    isolated_factory._next_reload_check = 0.0
+    assert isolated_factory.get_categorizer() is categorizer
+    assert categorizer.categorize("Buy groceries", None) == "urgent"
+
+
+def test_keyword_matcher_without_keywords_returns_default():
+    """Test an empty rule set matches nothing instead of failing"""
+    matcher = KeywordMatcher([("urgent", set()), ("work", set())], default="none")
+    assert matcher.match("anything at all", "really") == "none"
+    assert matcher.match_many([("anything", None)]) == ["none"]
@@ -0,0 +1,155 @@
+import asyncio
+import pytest
+from datetime import datetime
+from httpx import AsyncClient
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+from backend.app.main import app
+from backend.app.services.cache import INVALIDATE_PAGES
+from backend.app.services.coalescing import (
+    SingleFlight,
+    apply_invalidation,
+    task_flight_key,
+)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_concurrent_calls():
+    """Test coalescing: concurrent callers with one key share a single call"""
+    flights = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def read():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    waiters = [asyncio.create_task(flights.do("k", read, 1)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [1] * 5
+    assert calls == 1
+    assert flights.stats() == {"in_flight": 0, "started": 1, "shared": 4}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_errors_reach_every_caller():
+    """Test coalescing: a failed call fails all waiters and is not reused"""
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flights.do("k", fail, 1), flights.do("k", fail, 1), return_exceptions=True
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flights.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_timeout_forgets_key_without_cancelling():
+    """Test coalescing: a timed-out caller leaves the call running for others"""
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+        return "done"
+
+    patient = asyncio.create_task(flights.do("k", slow, 5))
+    with pytest.raises(asyncio.TimeoutError):
+        await flights.do("k", slow, 0.01)
+    assert flights.stats()["in_flight"] == 0
+
+    release.set()
+    assert await patient == "done"
+
+
+@pytest.mark.asyncio
+async def test_invalidation_mid_flight_starts_a_fresh_call():
+    """Test coalescing: callers arriving after a write do not join older reads"""
+    flights = SingleFlight()
+    release = asyncio.Event()
+    versions = iter(["before", "after"])
+
+    async def read():
+        value = next(versions)
+        await release.wait()
+        return value
+
+    task_id = uuid4()
+    early = asyncio.create_task(flights.do(task_flight_key(task_id), read, 1))
+    await asyncio.sleep(0)
+
+    apply_invalidation(flights, str(task_id))
+    late = asyncio.create_task(flights.do(task_flight_key(task_id), read, 1))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await early == "before"
+    assert await late == "after"
+
+
+def test_invalidation_pages_keeps_task_flights():
+    """Test coalescing: list writes forget list reads but not task reads"""
+    flights = SingleFlight()
+    flights._flights = {
+        task_flight_key("a", True): object(),
+        ("page", 50, None, "-created_at", (), "application/json", None, True): object(),
+        ("list_version", True): object(),
+    }
+
+    apply_invalidation(flights, INVALIDATE_PAGES)
+
+    assert list(flights._flights) == [task_flight_key("a", True)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_task_requests_share_one_query():
+    """Test API: simultaneous GETs of one task hit the database once"""
+    task_id = uuid4()
+    release = asyncio.Event()
+
+    async def fetchrow(*args):
+        await release.wait()
+        return (
+            task_id,
+            "Shared read",
+            None,
+            "work",
+            None,
+            datetime.now(),
+            datetime.now(),
+        )
+
+    mock_connection = AsyncMock()
+    mock_connection.fetchrow = AsyncMock(side_effect=fetchrow)
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return mock_connection
+
+        async def __aexit__(self, *args):
+            pass
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            requests = [
+                asyncio.create_task(client.get(f"/api/tasks/{task_id}"))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            release.set()
+            responses = await asyncio.gather(*requests)
+
+    assert [response.status_code for response in responses] == [200] * 3
+    assert {response.json()["id"] for response in responses} == {str(task_id)}
+    mock_connection.fetchrow.assert_called_once()
@@ -0,0 +1,116 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.app import database
+from backend.app.database import DatabaseConnectionPool
+from backend.app.services.events import (
+    RESYNC_EVENT,
+    TASK_EVENTS_CHANNEL,
+    EventBroadcaster,
+    SubscriberLimitError,
+    format_sse,
+)
+
+
+@pytest.fixture
+def mock_listener():
+    with patch(
+        "backend.app.database.DatabaseConnectionPool.add_listener",
+        new_callable=AsyncMock,
+    ) as add_listener:
+        yield add_listener
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_fans_out_to_subscribers(mock_listener):
+    """Test events: every subscriber receives each notification"""
+    broadcaster = EventBroadcaster(queue_size=10, max_subscribers=10)
+    first = await broadcaster.subscribe()
+    second = await broadcaster.subscribe()
+
+    broadcaster.on_notify(None, 1, TASK_EVENTS_CHANNEL, '{"type": "created"}')
+
+    assert first.get_nowait() == '{"type": "created"}'
+    assert second.get_nowait() == '{"type": "created"}'
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_listens_once(mock_listener):
+    """Test events: one LISTEN is shared by all subscribers"""
+    broadcaster = EventBroadcaster(queue_size=10, max_subscribers=10)
+    await asyncio.gather(*(broadcaster.subscribe() for _ in range(5)))
+
+    mock_listener.assert_awaited_once_with(
+        TASK_EVENTS_CHANNEL,
+        broadcaster.on_notify,
+        on_reconnect=broadcaster.on_reconnect,
+    )
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_replaces_backlog_with_resync(mock_listener):
+    """Test events: a slow subscriber gets a resync instead of unbounded growth"""
+    broadcaster = EventBroadcaster(queue_size=2, max_subscribers=10)
+    slow = await broadcaster.subscribe()
+
+    for i in range(3):
+        broadcaster.publish(str(i))
+
+    assert slow.qsize() == 1
+    assert slow.get_nowait() == RESYNC_EVENT
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_subscriber_limit(mock_listener):
+    """Test events: subscribing past the limit is refused"""
+    broadcaster = EventBroadcaster(queue_size=2, max_subscribers=1)
+    queue = await broadcaster.subscribe()
+
+    with pytest.raises(SubscriberLimitError):
+        await broadcaster.subscribe()
+
+    broadcaster.unsubscribe(queue)
+    await broadcaster.subscribe()
+    assert broadcaster.subscriber_count == 1
+
+
+def test_format_sse():
+    """Test events: messages use the Server-Sent Events wire format"""
+    assert format_sse('{"a": 1}') == b'data: {"a": 1}\n\n'
+    assert format_sse("{}", event="resync") == b"event: resync\ndata: {}\n\n"
+
+
+def _listen_connection():
+    connection = MagicMock()
+    connection.add_listener = AsyncMock()
+    connection.close = AsyncMock()
+    return connection
+
+
+@pytest.mark.asyncio
+async def test_listener_reconnects_and_resyncs(monkeypatch):
+    """Test events: a dropped LISTEN connection is reopened and triggers resync"""
+    first, second = _listen_connection(), _listen_connection()
+    connect = AsyncMock(side_effect=[first, OSError("refused"), second])
+    monkeypatch.setattr(database.asyncpg, "connect", connect)
+    monkeypatch.setattr(database, "_LISTENER_RETRY_INITIAL", 0)
+    db_pool = DatabaseConnectionPool()
+    monkeypatch.setattr(db_pool, "_listener", None)
+    monkeypatch.setattr(db_pool, "_channels", {})
+    monkeypatch.setattr(db_pool, "_reconnect_task", None)
+
+    broadcaster = EventBroadcaster(queue_size=10, max_subscribers=10)
+    queue = await broadcaster.subscribe()
+    on_terminated = first.add_termination_listener.call_args.args[0]
+
+    on_terminated(first)
+    assert db_pool._listener is None
+    await db_pool._reconnect_task
+
+    assert db_pool._listener is second
+    second.add_listener.assert_awaited_once_with(
+        TASK_EVENTS_CHANNEL, broadcaster.on_notify
+    )
+    assert queue.get_nowait() == RESYNC_EVENT
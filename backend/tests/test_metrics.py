@@ -0,0 +1,107 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from httpx import AsyncClient
+
+from backend.app import database
+from backend.app.database import DatabaseConnectionPool
+from backend.app.main import app
+from backend.app.metrics import Counter, Histogram, MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test metrics: histogram buckets are cumulative with sum and count"""
+    registry = MetricsRegistry()
+    histogram = registry.register(
+        Histogram("latency_seconds", "Latency", labelnames=("route",), buckets=(0.1, 1))
+    )
+    histogram.observe(0.05, route="/a")
+    histogram.observe(0.5, route="/a")
+    histogram.observe(5, route="/a")
+
+    text = registry.render()
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{route="/a"} 3' in text
+
+
+def test_counter_escapes_label_values():
+    """Test metrics: label values are escaped in the text format"""
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("errors_total", "Errors", ("reason",)))
+    counter.inc(reason='say "hi"')
+
+    assert 'errors_total{reason="say \\"hi\\""} 1.0' in registry.render()
+
+
+def test_registry_rejects_duplicate_names():
+    """Test metrics: metric names are unique per registry"""
+    registry = MetricsRegistry()
+    registry.register(Counter("a_total", "A"))
+    with pytest.raises(ValueError):
+        registry.register(Counter("a_total", "A again"))
+
+
+@pytest.mark.asyncio
+async def test_pool_acquire_timeout_is_counted():
+    """Test metrics: acquisitions that time out are counted, then re-raised"""
+
+    class TimingOutAcquire:
+        async def __aenter__(self):
+            raise asyncio.TimeoutError
+
+        async def __aexit__(self, *args):
+            pass
+
+    before = database.POOL_ACQUIRE_TIMEOUTS.value()
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = TimingOutAcquire()
+
+        with pytest.raises(asyncio.TimeoutError):
+            async with DatabaseConnectionPool().acquire():
+                pass
+
+    assert database.POOL_ACQUIRE_TIMEOUTS.value() == before + 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_route_latency():
+    """Test API: /metrics exposes per-route latency by path template"""
+    mock_conn = AsyncMock()
+    mock_conn.fetchrow = AsyncMock(return_value=None)
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return mock_conn
+
+        async def __aexit__(self, *args):
+            pass
+
+    live_pool = MagicMock()
+    live_pool.get_size.return_value = 5
+    live_pool.get_idle_size.return_value = 2
+    live_pool.get_max_size.return_value = 10
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value = MagicMock()
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        with patch.object(DatabaseConnectionPool(), "_pool", live_pool):
+            async with AsyncClient(app=app, base_url="http://test") as client:
+                await client.get("/api/tasks/00000000-0000-0000-0000-000000000000")
+                response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert (
+        'http_request_duration_seconds_count{method="GET",'
+        'route="/api/tasks/{task_id}",status="404"}'
+    ) in response.text
+    assert "db_pool_acquire_wait_seconds_count" in response.text
+    # The gauges read the singleton's live pool, not the class default
+    assert "db_pool_connections_in_use 3.0" in response.text
+    assert "db_pool_connections_idle 2.0" in response.text
+    assert "db_pool_connections_max 10.0" in response.text
@@ -0,0 +1,137 @@
+import gzip
+import msgpack
+import pytest
+from datetime import datetime, timezone
+from httpx import AsyncClient
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from backend.app.main import app
+from backend.app.negotiation import (
+    COLUMNAR_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    Representation,
+    negotiate_encoding,
+    negotiate_media_type,
+    render,
+)
+from backend.app.serialization import dumps_msgpack
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, JSON_MEDIA_TYPE),
+        ("*/*", JSON_MEDIA_TYPE),
+        ("application/json, text/plain, */*", JSON_MEDIA_TYPE),
+        ("text/html", JSON_MEDIA_TYPE),
+        ("application/msgpack", MSGPACK_MEDIA_TYPE),
+        ("application/x-msgpack", MSGPACK_MEDIA_TYPE),
+        (f"application/json;q=0.5, {COLUMNAR_MEDIA_TYPE}", COLUMNAR_MEDIA_TYPE),
+        ("application/json;q=0, */*", COLUMNAR_MEDIA_TYPE),
+    ],
+)
+def test_negotiate_media_type(accept, expected):
+    """Test negotiation: explicit types win, plain JSON wins ties and fallbacks"""
+    assert negotiate_media_type(accept) == expected
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("identity", None),
+        ("gzip, deflate", "gzip"),
+        ("gzip, deflate, br", "br"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("*", "br"),
+        ("*, br;q=0", "gzip"),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    """Test negotiation: brotli preferred over gzip unless qualities say otherwise"""
+    assert negotiate_encoding(accept_encoding) == expected
+
+
+def test_render_compresses_only_above_threshold():
+    """Test negotiation: small bodies are sent uncompressed"""
+    representation = Representation(JSON_MEDIA_TYPE, "gzip")
+    content = {"items": [], "next_cursor": "x" * 100}
+
+    small, encoding = render(content, representation, min_size=1024)
+    assert encoding is None
+
+    large, encoding = render(content, representation, min_size=10)
+    assert encoding == "gzip"
+    assert gzip.decompress(large) == small
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2026, 10, 18, 0, 0, 0, 1, tzinfo=timezone.utc),
+        datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc),
+    ],
+)
+def test_msgpack_timestamps_keep_every_microsecond(value):
+    """Test serialization: MessagePack timestamps round-trip exactly"""
+    assert msgpack.unpackb(dumps_msgpack({"at": value}), timestamp=3)["at"] == value
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_msgpack_brotli():
+    """Test API: service clients get compressed MessagePack, with its own ETag"""
+    now = datetime.now(timezone.utc)
+    rows = [
+        (
+            uuid4(),
+            f"Task {i}",
+            "Collect the latest figures for the client.",
+            "work",
+            30,
+            now,
+            now,
+        )
+        for i in range(20)
+    ]
+    class MockTransaction:
+        async def __aenter__(self):
+            return None
+
+        async def __aexit__(self, *args):
+            pass
+
+    mock_connection = AsyncMock()
+    mock_connection.fetchval = AsyncMock(return_value=3)
+    mock_connection.fetch = AsyncMock(return_value=rows)
+    mock_connection.transaction = MagicMock(return_value=MockTransaction())
+
+    class MockAcquireContext:
+        async def __aenter__(self):
+            return mock_connection
+
+        async def __aexit__(self, *args):
+            pass
+
+    with patch("backend.app.database.DatabaseConnectionPool.get_pool") as mock_pool:
+        mock_pool.return_value.acquire.return_value = MockAcquireContext()
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            plain = await client.get("/api/tasks", params={"limit": 50})
+            packed = await client.get(
+                "/api/tasks",
+                params={"limit": 50},
+                headers={"Accept": MSGPACK_MEDIA_TYPE, "Accept-Encoding": "br"},
+            )
+
+    assert plain.headers["content-type"] == JSON_MEDIA_TYPE
+    assert packed.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    assert packed.headers["content-encoding"] == "br"
+    assert packed.headers["vary"] == "Accept, Accept-Encoding"
+    assert packed.headers["etag"] != plain.headers["etag"]
+
+    # httpx has already undone the brotli coding
+    items = msgpack.unpackb(packed.content, timestamp=3)["items"]
+    assert [item["title"] for item in items] == [f"Task {i}" for i in range(20)]
+    assert items[0]["created_at"] == now
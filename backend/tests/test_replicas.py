@@ -0,0 +1,116 @@
+import asyncio
+import pytest
+from fastapi import FastAPI, Request
+from httpx import AsyncClient
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.app.config import get_settings
+from backend.app.consistency import (
+    READ_PRIMARY_COOKIE,
+    ReadYourWritesMiddleware,
+    reads_from_primary,
+)
+from backend.app.database import DatabaseConnectionPool, Replica
+
+
+def _mock_pool(name, error=None):
+    """Pool whose acquire() yields `name`, or raises `error` on entry"""
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=name, side_effect=error)
+    context.__aexit__ = AsyncMock(return_value=False)
+    pool = MagicMock()
+    pool.acquire.return_value = context
+    return pool
+
+
+def _replica(name, healthy=True, error=None):
+    replica = Replica(f"postgresql://{name}")
+    replica.pool = _mock_pool(name, error)
+    replica.healthy = healthy
+    return replica
+
+
+@pytest.fixture
+def db_pool():
+    saved = DatabaseConnectionPool._pool, DatabaseConnectionPool._replicas
+    DatabaseConnectionPool._pool = _mock_pool("primary")
+    DatabaseConnectionPool._replica_index = 0
+    yield DatabaseConnectionPool()
+    DatabaseConnectionPool._pool, DatabaseConnectionPool._replicas = saved
+
+
+async def _acquire(db_pool, readonly=True):
+    async with db_pool.acquire(readonly=readonly) as connection:
+        return connection
+
+
+@pytest.mark.asyncio
+async def test_reads_round_robin_over_healthy_replicas(db_pool):
+    """Test replicas: reads rotate across healthy replicas only"""
+    DatabaseConnectionPool._replicas = (
+        _replica("a"),
+        _replica("b", healthy=False),
+        _replica("c"),
+    )
+
+    used = [await _acquire(db_pool) for _ in range(4)]
+
+    assert used == ["a", "c", "a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_writes_use_primary(db_pool):
+    """Test replicas: connections for writes always come from the primary"""
+    DatabaseConnectionPool._replicas = (_replica("a"),)
+
+    assert await _acquire(db_pool, readonly=False) == "primary"
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_falls_back_to_primary(db_pool):
+    """Test replicas: a connection failure marks the replica down"""
+    replica = _replica("a", error=OSError("connection refused"))
+    DatabaseConnectionPool._replicas = (replica,)
+
+    assert await _acquire(db_pool) == "primary"
+    assert replica.healthy is False
+
+
+@pytest.mark.asyncio
+async def test_busy_replica_falls_back_to_primary_quickly(db_pool):
+    """Test replicas: a full replica is skipped, a slow one waits briefly"""
+    full = _replica("full")
+    full.pool.get_idle_size.return_value = 0
+    full.pool.get_size.return_value = full.pool.get_max_size.return_value = 10
+    slow = _replica("slow", error=asyncio.TimeoutError())
+    DatabaseConnectionPool._replicas = (full, slow)
+
+    assert await _acquire(db_pool) == "primary"
+    full.pool.acquire.assert_not_called()
+
+    assert await _acquire(db_pool) == "primary"
+    assert slow.pool.acquire.call_args[1]["timeout"] == (
+        get_settings().db_replica_acquire_timeout
+    )
+    assert slow.healthy is True
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes_cookie():
+    """Test replicas: a successful write pins the client's reads to the primary"""
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, window=5)
+
+    @app.post("/write")
+    async def write():
+        return {}
+
+    @app.get("/read")
+    async def read(request: Request):
+        return {"primary": reads_from_primary(request)}
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        assert (await client.get("/read")).json() == {"primary": False}
+        response = await client.post("/write")
+        assert READ_PRIMARY_COOKIE in response.cookies
+        assert (await client.get("/read")).json() == {"primary": True}
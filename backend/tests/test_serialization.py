@@ -0,0 +1,77 @@
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import msgpack
+import pytest
+
+from backend.app.models.task import Task
+from backend.app.schemas.task import TaskResponse
+from backend.app.serialization import (
+    TASK_FIELDS,
+    dumps,
+    dumps_columnar,
+    dumps_msgpack,
+)
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [datetime.now(timezone.utc), datetime.now(), datetime(2025, 1, 15, 10, 0)],
+)
+def test_dumps_matches_response_model_format(timestamp):
+    """Test fast path produces the same JSON as TaskResponse validation"""
+    task = Task(
+        id=uuid4(),
+        title="Complete project report",
+        description=None,
+        category="work",
+        estimated_time=120,
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+
+    expected = TaskResponse.model_validate(task.to_dict()).model_dump(mode="json")
+    assert json.loads(dumps(task)) == expected
+
+
+def test_dumps_rejects_unknown_objects():
+    """Test unsupported objects still raise instead of being silently dropped"""
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def _task(timestamp):
+    return Task(
+        id=uuid4(),
+        title="Plan sprint",
+        description=None,
+        category="work",
+        estimated_time=30,
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+
+
+def test_dumps_columnar_stores_task_lists_as_columns():
+    """Test columnar JSON: one array per field, other keys unchanged"""
+    tasks = [_task(datetime.now(timezone.utc)) for _ in range(3)]
+
+    content = json.loads(dumps_columnar({"items": tasks, "next_cursor": "abc"}))
+
+    assert content["next_cursor"] == "abc"
+    assert set(content["items"]) == set(TASK_FIELDS)
+    assert content["items"]["id"] == [str(task.id) for task in tasks]
+    assert content["items"]["title"] == ["Plan sprint"] * 3
+
+
+def test_dumps_msgpack_uses_native_timestamps():
+    """Test MessagePack: datetimes round-trip as UTC timestamps, ids as strings"""
+    naive = datetime(2025, 1, 15, 10, 0)
+    task = _task(naive)
+
+    decoded = msgpack.unpackb(dumps_msgpack({"items": [task]}), timestamp=3)
+
+    item = decoded["items"][0]
+    assert item["id"] == str(task.id)
+    assert item["created_at"] == naive.replace(tzinfo=timezone.utc)
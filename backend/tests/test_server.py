@@ -0,0 +1,133 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from httpx import AsyncClient
+
+from backend.app.config import Settings
+from backend.app.database import DatabaseConnectionPool, pool_size_limits
+from backend.app.main import app
+from backend.app.server import build_config
+
+
+def _settings(**overrides):
+    return Settings(
+        database_url="postgresql+asyncpg://u:p@localhost/db",
+        postgres_user="u",
+        postgres_password="p",
+        postgres_db="db",
+        **overrides,
+    )
+
+
+def test_pool_size_without_budget_uses_configured_sizes():
+    """Test server: without a budget each worker uses db_pool_min/max_size"""
+    settings = _settings(server_workers=4)
+    with patch("backend.app.database.get_settings", return_value=settings):
+        assert pool_size_limits() == (10, 20)
+
+
+def test_pool_size_divides_budget_across_workers():
+    """Test server: the budget is shared, leaving one LISTEN slot per worker"""
+    settings = _settings(server_workers=4, db_connection_budget=40)
+    with patch("backend.app.database.get_settings", return_value=settings):
+        assert pool_size_limits() == (9, 9)
+
+
+def test_pool_size_rejects_budget_too_small():
+    """Test server: a budget that cannot cover every worker fails fast"""
+    settings = _settings(server_workers=8, db_connection_budget=8)
+    with patch("backend.app.database.get_settings", return_value=settings):
+        with pytest.raises(ValueError):
+            pool_size_limits()
+
+
+def test_build_config_selects_uvloop_and_httptools():
+    """Test server: event loop and HTTP parser are chosen explicitly"""
+    settings = _settings(server_workers=3, server_graceful_timeout=12)
+    with patch("backend.app.server.get_settings", return_value=settings), patch(
+        "backend.app.database.get_settings", return_value=settings
+    ):
+        config = build_config()
+
+    assert config["workers"] == 3
+    assert config["loop"] == "uvloop"
+    assert config["http"] == "httptools"
+    assert config["timeout_graceful_shutdown"] == 12
+
+
+@pytest.fixture
+def fresh_pool():
+    db_pool = DatabaseConnectionPool()
+    saved = dict(vars(db_pool))
+    yield db_pool
+    vars(db_pool).clear()
+    vars(db_pool).update(saved)
+
+
+def _mock_pool(connection):
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=connection)
+    context.__aexit__ = AsyncMock(return_value=False)
+    pool = MagicMock()
+    pool.acquire.return_value = context
+    pool.get_size.return_value = 1
+    pool.get_idle_size.return_value = 1
+    pool.get_max_size.return_value = 20
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_warm_up_opens_and_releases_connections(fresh_pool):
+    """Test server: warm-up releases each connection without waiting for all"""
+    slow_connect = asyncio.Event()
+    opened = 0
+
+    async def acquire():
+        nonlocal opened
+        opened += 1
+        if opened == 1:
+            await slow_connect.wait()
+        return object()
+
+    pool = MagicMock()
+    pool.acquire = AsyncMock(side_effect=acquire)
+    pool.release = AsyncMock()
+
+    warm_up = asyncio.create_task(fresh_pool._warm_up(pool, 5))
+    await asyncio.sleep(0.01)
+    assert pool.acquire.await_count == 5
+    assert pool.release.await_count == 4
+
+    slow_connect.set()
+    await warm_up
+    assert pool.release.await_count == 5
+    assert fresh_pool._warm is True
+
+
+@pytest.mark.asyncio
+async def test_ready_is_unavailable_before_pool_exists(fresh_pool):
+    """Test API: /api/ready reports 503 while the pool is not open"""
+    fresh_pool._pool = None
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/api/ready")
+
+    assert response.status_code == 503
+    assert response.json()["pool"] is None
+
+
+@pytest.mark.asyncio
+async def test_ready_caches_liveness_probe(fresh_pool):
+    """Test API: /api/ready probes the database at most once per TTL"""
+    connection = AsyncMock()
+    connection.fetchval = AsyncMock(return_value=1)
+    fresh_pool._pool = _mock_pool(connection)
+    fresh_pool._liveness = (float("-inf"), False)
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        first = await client.get("/api/ready")
+        second = await client.get("/api/ready")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json()["pool"]["max_size"] == 20
+    connection.fetchval.assert_awaited_once()
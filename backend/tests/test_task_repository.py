@@ -1,7 +1,18 @@
+import itertools
 import pytest
-from unittest.mock import AsyncMock
+import tracemalloc
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
-from backend.app.repositories.task_repository import TaskRepository
+from datetime import datetime
+from backend.app.commands.task_stats import check_stats
+from backend.app.repositories.task_repository import (
+    PREPARED_STATEMENTS,
+    STATEMENTS,
+    UNSET,
+    TaskRepository,
+    build_page_query,
+    prepare_statements,
+)
 
 
 @pytest.mark.asyncio
@@ -71,20 +82,226 @@ async def test_repository_update_task(mock_db_connection, sample_task_row):
 @pytest.mark.asyncio
 async def test_repository_delete_task_success(mock_db_connection):
     """Test Repository pattern: successful deletion"""
-    mock_db_connection.execute = AsyncMock(return_value="DELETE 1")
+    task_id = uuid4()
+    mock_db_connection.fetchval = AsyncMock(return_value=task_id)
 
     repository = TaskRepository(mock_db_connection)
-    result = await repository.delete(uuid4())
+    result = await repository.delete(task_id)
 
     assert result is True
+    query = mock_db_connection.fetchval.call_args[0][0]
+    assert "task_tombstones" in query
 
 
 @pytest.mark.asyncio
 async def test_repository_delete_task_not_found(mock_db_connection):
     """Test Repository pattern: delete non-existent task"""
-    mock_db_connection.execute = AsyncMock(return_value="DELETE 0")
+    mock_db_connection.fetchval = AsyncMock(return_value=None)
 
     repository = TaskRepository(mock_db_connection)
     result = await repository.delete(uuid4())
 
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_repository_get_page_first_page(mock_db_connection, sample_task_row):
+    """Test Repository pattern: first page has no keyset condition"""
+    mock_db_connection.fetch = AsyncMock(return_value=[sample_task_row])
+
+    repository = TaskRepository(mock_db_connection)
+    tasks = await repository.get_page(limit=10)
+
+    assert len(tasks) == 1
+    query, limit = mock_db_connection.fetch.call_args[0]
+    assert "WHERE" not in query
+    assert limit == 10
+
+
+@pytest.mark.asyncio
+async def test_repository_get_page_after_cursor(mock_db_connection, sample_task_row):
+    """Test Repository pattern: subsequent pages resume after the keyset"""
+    mock_db_connection.fetch = AsyncMock(return_value=[sample_task_row])
+    created_at, task_id = datetime.now(), uuid4()
+
+    repository = TaskRepository(mock_db_connection)
+    await repository.get_page(limit=10, after=(created_at, task_id))
+
+    query, *params = mock_db_connection.fetch.call_args[0]
+    assert "(created_at, id) < ($1, $2)" in query
+    assert params == [created_at, task_id, 10]
+
+
+@pytest.mark.asyncio
+async def test_repository_create_many(mock_db_connection, sample_task_row):
+    """Test Repository pattern: batch insert uses one statement"""
+    mock_db_connection.fetch = AsyncMock(
+        return_value=[sample_task_row, sample_task_row]
+    )
+
+    repository = TaskRepository(mock_db_connection)
+    tasks = await repository.create_many(
+        [("First", None, "work", 30), ("Second", "Details", "personal", None)]
+    )
+
+    assert len(tasks) == 2
+    _, titles, descriptions, categories, times = mock_db_connection.fetch.call_args[0]
+    assert titles == ["First", "Second"]
+    assert descriptions == [None, "Details"]
+    assert categories == ["work", "personal"]
+    assert times == [30, None]
+    mock_db_connection.fetch.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_repository_create_many_empty(mock_db_connection):
+    """Test Repository pattern: empty batch skips the database"""
+    repository = TaskRepository(mock_db_connection)
+    tasks = await repository.create_many([])
+
+    assert tasks == []
+    mock_db_connection.fetch.assert_not_called()
+
+
+class _MockTransaction:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *args):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_repository_apply_batch(mock_db_connection, sample_task_row):
+    """Test Repository pattern: batch updates and deletes share a transaction"""
+    deleted_id = uuid4()
+    mock_db_connection.transaction = MagicMock(return_value=_MockTransaction())
+    mock_db_connection.fetch = AsyncMock(
+        side_effect=[[sample_task_row], [{"id": deleted_id}]]
+    )
+
+    repository = TaskRepository(mock_db_connection)
+    updated, deleted = await repository.apply_batch(
+        updates=[(uuid4(), "New title", None, "work", None)],
+        delete_ids=[deleted_id, uuid4()],
+    )
+
+    assert len(updated) == 1
+    assert deleted == {deleted_id}
+    mock_db_connection.transaction.assert_called_once()
+    assert mock_db_connection.fetch.call_count == 2
+
+
+def test_row_to_task_memory_per_task(sample_task_data):
+    """Test mapped tasks stay compact: no per-instance __dict__"""
+    rows = [tuple(sample_task_data.values())] * 10_000
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tasks = [TaskRepository._row_to_task(row) for row in rows]
+        per_task = (tracemalloc.get_traced_memory()[0] - before) / len(tasks)
+    finally:
+        tracemalloc.stop()
+
+    assert not hasattr(tasks[0], "__dict__")
+    # ~96 bytes with slots on CPython 3.11; the __dict__-based class used ~145
+    assert per_task < 120
+
+
+@pytest.mark.asyncio
+async def test_repository_update_uses_single_statement(
+    mock_db_connection, sample_task_row
+):
+    """Test Repository pattern: every field combination reuses one cached statement"""
+    mock_db_connection.fetchrow = AsyncMock(return_value=sample_task_row)
+    repository = TaskRepository(mock_db_connection)
+
+    for fields in itertools.product([False, True], repeat=4):
+        title, description, category, estimated_time = fields
+        await repository.update(
+            task_id=uuid4(),
+            title="Title" if title else None,
+            description="Text" if description else UNSET,
+            category="work" if category else None,
+            estimated_time=30 if estimated_time else UNSET,
+        )
+
+    queries = {call.args[0] for call in mock_db_connection.fetchrow.call_args_list}
+    update_queries = queries - {STATEMENTS["get_by_id"]}
+    assert update_queries == {STATEMENTS["update"]}
+
+
+@pytest.mark.asyncio
+async def test_repository_update_can_clear_description(
+    mock_db_connection, sample_task_row
+):
+    """Test Repository pattern: explicit None clears nullable columns"""
+    mock_db_connection.fetchrow = AsyncMock(return_value=sample_task_row)
+    task_id = uuid4()
+
+    repository = TaskRepository(mock_db_connection)
+    await repository.update(task_id=task_id, description=None)
+
+    _, *params = mock_db_connection.fetchrow.call_args[0]
+    assert params == [task_id, None, True, None, None, False, None]
+
+
+@pytest.mark.asyncio
+async def test_prepare_statements_populates_statement_cache(mock_db_connection):
+    """Test pool init hook prepares hot statements into the statement cache"""
+    mock_db_connection._prepare = AsyncMock()
+
+    await prepare_statements(mock_db_connection)
+
+    prepared = [call.args[0] for call in mock_db_connection._prepare.call_args_list]
+    assert prepared == [STATEMENTS[name] for name in PREPARED_STATEMENTS]
+    for call in mock_db_connection._prepare.call_args_list:
+        assert call.kwargs == {"use_cache": True}
+
+
+def test_build_page_query_binds_filters_in_fixed_order():
+    """Test Repository pattern: filters become bound parameters, not literals"""
+    created_at, task_id = datetime.now(), uuid4()
+    query, args = build_page_query(
+        limit=10,
+        after=(created_at, task_id),
+        filters={"max_estimated_time": 60, "category": "work"},
+        sort="-created_at",
+    )
+
+    assert "category = $1" in query
+    assert "estimated_time <= $2" in query
+    assert "(created_at, id) < ($3, $4)" in query
+    assert "ORDER BY created_at DESC, id DESC" in query
+    assert "LIMIT $5" in query
+    assert args == ["work", 60, created_at, task_id, 10]
+
+
+def test_build_page_query_ascending_sort():
+    """Test Repository pattern: ascending sort flips keyset comparison"""
+    updated_at, task_id = datetime.now(), uuid4()
+    query, args = build_page_query(
+        limit=5, after=(updated_at, task_id), filters={}, sort="updated_at"
+    )
+
+    assert "(updated_at, id) > ($1, $2)" in query
+    assert "ORDER BY updated_at ASC, id ASC" in query
+    assert args == [updated_at, task_id, 5]
+
+
+@pytest.mark.asyncio
+async def test_check_stats_reports_drift(mock_db_connection, capsys):
+    """Test stats consistency check compares summary with full aggregate"""
+    mock_db_connection.fetch = AsyncMock(
+        side_effect=[
+            [("work", 2, 60), ("urgent", 1, 0)],
+            [("work", 2, 60), ("personal", 1, 30)],
+        ]
+    )
+
+    consistent = await check_stats(TaskRepository(mock_db_connection))
+
+    assert consistent is False
+    output = capsys.readouterr().out
+    assert "personal" in output and "urgent" in output and "work" not in output
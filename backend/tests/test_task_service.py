@@ -3,7 +3,14 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 from backend.app.services.task_service import TaskService
 from backend.app.models.task import Task
-from datetime import datetime
+from backend.app.services.pagination import (
+    SyncTokenExpiredError,
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+)
+from backend.app.services.cache import TTLCache
+from datetime import datetime, timedelta, timezone
 
 
 @pytest.mark.asyncio
@@ -101,3 +108,266 @@ async def test_service_update_task():
     )
 
     mock_repo.update.assert_called_once()
+
+
+def _make_tasks(count):
+    now = datetime.now(timezone.utc)
+    return [
+        Task(
+            id=uuid4(),
+            title=f"Task {i}",
+            description=None,
+            category="personal",
+            estimated_time=None,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_service_get_tasks_page_returns_next_cursor():
+    """Test Service layer: full page yields cursor pointing at its last task"""
+    mock_repo = MagicMock()
+    tasks = _make_tasks(3)
+    mock_repo.get_page = AsyncMock(return_value=tasks)
+
+    service = TaskService(mock_repo)
+    page, next_cursor = await service.get_tasks_page(limit=2)
+
+    assert page == tasks[:2]
+    assert decode_cursor(next_cursor) == (tasks[1].created_at, tasks[1].id)
+    mock_repo.get_page.assert_called_once_with(limit=3, after=None)
+
+
+@pytest.mark.asyncio
+async def test_service_get_tasks_page_last_page():
+    """Test Service layer: short page has no next cursor"""
+    mock_repo = MagicMock()
+    tasks = _make_tasks(1)
+    mock_repo.get_page = AsyncMock(return_value=tasks)
+
+    service = TaskService(mock_repo)
+    cursor = encode_cursor(datetime.now(timezone.utc), uuid4())
+    page, next_cursor = await service.get_tasks_page(limit=2, cursor=cursor)
+
+    assert page == tasks
+    assert next_cursor is None
+    assert mock_repo.get_page.call_args[1]["after"] == decode_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_service_create_tasks_categorizes_each_item():
+    """Test Service layer: batch creation categorizes before a single insert"""
+    mock_repo = MagicMock()
+    mock_repo.create_many = AsyncMock(return_value=[])
+
+    service = TaskService(mock_repo)
+    await service.create_tasks(
+        [
+            ("Restart server asap", None, 15),
+            ("Client meeting", "Quarterly review", 60),
+            ("Buy milk", None, None),
+        ]
+    )
+
+    rows = mock_repo.create_many.call_args[0][0]
+    assert [row[2] for row in rows] == ["urgent", "work", "personal"]
+    mock_repo.create_many.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_service_get_task_uses_cache():
+    """Test Service layer: repeated reads are served from the cache"""
+    mock_repo = MagicMock()
+    task = _make_tasks(1)[0]
+    mock_repo.get_by_id = AsyncMock(return_value=task)
+
+    service = TaskService(mock_repo, cache=TTLCache(max_size=10, ttl=60))
+    assert await service.get_task(task.id) is task
+    assert await service.get_task(task.id) is task
+
+    mock_repo.get_by_id.assert_called_once_with(task.id)
+
+
+@pytest.mark.asyncio
+async def test_service_update_invalidates_cache():
+    """Test Service layer: updates evict the cached task"""
+    mock_repo = MagicMock()
+    task = _make_tasks(1)[0]
+    mock_repo.get_by_id = AsyncMock(return_value=task)
+    mock_repo.update = AsyncMock(return_value=task)
+
+    service = TaskService(mock_repo, cache=TTLCache(max_size=10, ttl=60))
+    await service.get_task(task.id)
+    await service.update_task(task_id=task.id, title="Changed")
+    await service.get_task(task.id)
+
+    assert mock_repo.get_by_id.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_service_search_tasks_pages_by_rank():
+    """Test Service layer: search cursor resumes after the last (rank, id)"""
+    mock_repo = MagicMock()
+    tasks = _make_tasks(3)
+    mock_repo.search = AsyncMock(
+        return_value=[(tasks[0], 0.9), (tasks[1], 0.5), (tasks[2], 0.1)]
+    )
+
+    service = TaskService(mock_repo)
+    page, next_cursor = await service.search_tasks("report", limit=2)
+
+    assert page == tasks[:2]
+    assert decode_rank_cursor(next_cursor) == (0.5, tasks[1].id)
+    mock_repo.search.assert_called_once_with("report", limit=3, after=None)
+
+
+@pytest.mark.asyncio
+async def test_service_filtered_page_uses_sort_column_for_cursor():
+    """Test Service layer: filtered pages bypass cache and key cursor by sort"""
+    mock_repo = MagicMock()
+    tasks = _make_tasks(3)
+    mock_repo.get_page = AsyncMock(return_value=tasks)
+
+    service = TaskService(mock_repo, cache=TTLCache(max_size=10, ttl=60))
+    page, next_cursor = await service.get_tasks_page(
+        2, sort="updated_at", category="personal"
+    )
+
+    assert decode_cursor(next_cursor) == (tasks[1].updated_at, tasks[1].id)
+    mock_repo.get_page.assert_called_once_with(
+        limit=3, after=None, sort="updated_at", category="personal"
+    )
+    assert service.cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_service_get_stats_totals():
+    """Test Service layer: stats add up per-category summary rows"""
+    mock_repo = MagicMock()
+    mock_repo.get_stats = AsyncMock(
+        return_value=[("personal", 3, 90), ("work", 2, 120)]
+    )
+
+    service = TaskService(mock_repo)
+    stats = await service.get_stats()
+
+    assert stats["total_count"] == 5
+    assert stats["total_estimated_time"] == 210
+    assert stats["categories"][1] == {
+        "category": "work",
+        "count": 2,
+        "total_estimated_time": 120,
+    }
+
+
+def _changed_task(updated_at):
+    return Task(
+        id=uuid4(),
+        title="Changed",
+        description=None,
+        category="personal",
+        estimated_time=None,
+        created_at=updated_at,
+        updated_at=updated_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_service_get_changes_pages_by_updated_at():
+    """Test Service layer: full change page resumes after its last task"""
+    old = datetime.now(timezone.utc) - timedelta(hours=1)
+    tasks = [_changed_task(old + timedelta(seconds=i)) for i in range(3)]
+    mock_repo = MagicMock()
+    mock_repo.get_page = AsyncMock(return_value=tasks)
+    mock_repo.get_tombstones = AsyncMock(return_value=[])
+
+    service = TaskService(mock_repo)
+    since = encode_cursor(old - timedelta(minutes=1), uuid4())
+    changed, deleted, token, has_more = await service.get_changes(2, since)
+
+    assert changed == tasks[:2]
+    assert has_more is True
+    assert decode_cursor(token) == (tasks[1].updated_at, tasks[1].id)
+    assert mock_repo.get_page.call_args[1]["sort"] == "updated_at"
+    assert mock_repo.get_tombstones.call_args[0] == (decode_cursor(since), 3)
+
+
+@pytest.mark.asyncio
+async def test_service_get_changes_pages_tombstones_with_tasks():
+    """Test Service layer: tombstones share the page limit, merged by time"""
+    old = datetime.now(timezone.utc) - timedelta(hours=1)
+    tasks = [_changed_task(old + timedelta(seconds=i)) for i in (0, 2)]
+    tombstones = [(uuid4(), old + timedelta(seconds=i)) for i in (1, 3)]
+    mock_repo = MagicMock()
+    mock_repo.get_page = AsyncMock(return_value=tasks)
+    mock_repo.get_tombstones = AsyncMock(return_value=tombstones)
+
+    service = TaskService(mock_repo)
+    since = encode_cursor(old - timedelta(minutes=1), uuid4())
+    changed, deleted, token, has_more = await service.get_changes(3, since)
+
+    assert changed == tasks
+    assert deleted == [tombstones[0][0]]
+    assert has_more is True
+    assert decode_cursor(token) == (tasks[1].updated_at, tasks[1].id)
+
+    changed, deleted, token, has_more = await service.get_changes(1, since)
+
+    assert (changed, deleted, has_more) == ([tasks[0]], [], True)
+    mock_repo.get_page = AsyncMock(return_value=tasks[1:])
+    changed, deleted, token, has_more = await service.get_changes(2, token)
+
+    assert (changed, deleted, has_more) == (tasks[1:], [tombstones[0][0]], True)
+    resumed_after = mock_repo.get_tombstones.call_args[0][0]
+    assert resumed_after == (tasks[0].updated_at, tasks[0].id)
+
+
+@pytest.mark.asyncio
+async def test_service_get_changes_holds_token_back_by_settle():
+    """Test Service layer: final token stays behind in-flight transactions"""
+    now = datetime.now(timezone.utc)
+    deleted_id = uuid4()
+    mock_repo = MagicMock()
+    mock_repo.get_page = AsyncMock(return_value=[_changed_task(now)])
+    mock_repo.get_tombstones = AsyncMock(return_value=[(deleted_id, now)])
+
+    service = TaskService(mock_repo)
+    since = encode_cursor(now - timedelta(minutes=1), uuid4())
+    _, deleted, token, has_more = await service.get_changes(
+        10, since, settle=timedelta(seconds=5)
+    )
+
+    assert deleted == [deleted_id]
+    assert has_more is False
+    assert decode_cursor(token)[0] < now
+    assert mock_repo.get_tombstones.call_args[0][1] == 11
+
+
+@pytest.mark.asyncio
+async def test_service_get_changes_full_sync_skips_tombstones():
+    """Test Service layer: no token returns all tasks and no tombstones"""
+    mock_repo = MagicMock()
+    mock_repo.get_page = AsyncMock(return_value=[])
+    mock_repo.get_tombstones = AsyncMock()
+
+    service = TaskService(mock_repo)
+    changed, deleted, token, has_more = await service.get_changes(10)
+
+    assert (changed, deleted, has_more) == ([], [], False)
+    assert mock_repo.get_page.call_args[1]["after"] is None
+    mock_repo.get_tombstones.assert_not_called()
+    decode_cursor(token)
+
+
+@pytest.mark.asyncio
+async def test_service_get_changes_rejects_expired_token():
+    """Test Service layer: tokens older than tombstone retention expire"""
+    mock_repo = MagicMock()
+    service = TaskService(mock_repo)
+    since = encode_cursor(datetime.now(timezone.utc) - timedelta(days=31), uuid4())
+
+    with pytest.raises(SyncTokenExpiredError):
+        await service.get_changes(10, since, retention=timedelta(days=30))
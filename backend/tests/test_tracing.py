@@ -0,0 +1,93 @@
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from backend.app.repositories.task_repository import STATEMENTS, TaskRepository
+from backend.app.tracing import (
+    DYNAMIC_STATEMENT,
+    add_timing_hook,
+    redact,
+    remove_timing_hook,
+)
+
+
+@pytest.fixture
+def timings():
+    recorded = []
+    add_timing_hook(recorded.append)
+    yield recorded
+    remove_timing_hook(recorded.append)
+
+
+def _settings(threshold_ms, explain=False):
+    return MagicMock(slow_query_threshold_ms=threshold_ms, slow_query_explain=explain)
+
+
+@pytest.mark.asyncio
+async def test_repository_statements_are_timed_by_name(timings):
+    """Test tracing: each statement is recorded with its name and row count"""
+    connection = AsyncMock()
+    connection.fetchval = AsyncMock(return_value=uuid4())
+
+    await TaskRepository(connection).delete(uuid4())
+
+    assert len(timings) == 1
+    assert timings[0].name == "delete"
+    assert timings[0].rows == 1
+
+
+@pytest.mark.asyncio
+async def test_unnamed_sql_is_timed_as_dynamic(timings):
+    """Test tracing: SQL outside STATEMENTS is recorded as dynamic"""
+    connection = AsyncMock()
+    connection.fetch = AsyncMock(return_value=[])
+
+    await TaskRepository(connection).get_page(limit=10, category="work")
+
+    assert timings[0].name == DYNAMIC_STATEMENT
+
+
+@pytest.mark.asyncio
+async def test_slow_query_log_redacts_parameters(caplog):
+    """Test tracing: slow statements are logged without parameter values"""
+    connection = AsyncMock()
+    connection.fetchval = AsyncMock(return_value=None)
+    task_id = uuid4()
+
+    with patch("backend.app.tracing.get_settings", return_value=_settings(0)):
+        with caplog.at_level(logging.WARNING, logger="backend.app.tracing"):
+            await TaskRepository(connection).delete(task_id)
+
+    assert "Slow query delete" in caplog.text
+    assert "$1=uuid" in caplog.text
+    assert str(task_id) not in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_slow_query_explain_is_rolled_back(caplog):
+    """Test tracing: debug EXPLAIN ANALYZE runs in a rolled back transaction"""
+    transaction = MagicMock()
+    transaction.start = AsyncMock()
+    transaction.rollback = AsyncMock()
+    connection = AsyncMock()
+    connection.transaction = MagicMock(return_value=transaction)
+    connection.fetchval = AsyncMock(return_value=uuid4())
+    connection.fetch = AsyncMock(return_value=[("Delete on tasks",)])
+
+    settings = _settings(0, explain=True)
+    with patch("backend.app.tracing.get_settings", return_value=settings):
+        with caplog.at_level(logging.WARNING, logger="backend.app.tracing"):
+            await TaskRepository(connection).delete(uuid4())
+
+    query = connection.fetch.call_args[0][0]
+    assert query == f"EXPLAIN (ANALYZE, BUFFERS) {STATEMENTS['delete']}"
+    transaction.rollback.assert_awaited_once()
+    assert "Delete on tasks" in caplog.text
+
+
+def test_redact_describes_types_only():
+    """Test tracing: redaction keeps only types and sizes"""
+    redacted = redact(["secret", None, 5, [1, 2]])
+    assert redacted == "$1=str[6], $2=NULL, $3=int, $4=list[2]"
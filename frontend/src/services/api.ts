@@ -1,10 +1,21 @@
 import axios from 'axios';
-import type { Task, CreateTaskInput, UpdateTaskInput } from '../types/task.types';
+import type {
+  Task,
+  TaskPage,
+  CreateTaskInput,
+  UpdateTaskInput,
+  TaskBatchOperation,
+  TaskBatchOperationResult,
+  TaskEvent,
+  TaskChanges,
+} from '../types/task.types';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
 const api = axios.create({
   baseURL: API_URL,
+  // Carries the read-your-writes cookie when the API uses read replicas
+  withCredentials: true,
   headers: {
     'Content-Type': 'application/json',
   },
@@ -16,8 +27,35 @@ export const taskApi = {
     return response.data;
   },
 
+  async getTasksPage(cursor?: string | null, limit?: number): Promise<TaskPage> {
+    const response = await api.get<TaskPage>('/api/tasks', {
+      params: { cursor: cursor ?? undefined, limit },
+    });
+    return response.data;
+  },
+
   async getAllTasks(): Promise<Task[]> {
-    const response = await api.get<Task[]>('/api/tasks');
+    const tasks: Task[] = [];
+    let cursor: string | null = null;
+    do {
+      const page: TaskPage = await taskApi.getTasksPage(cursor);
+      tasks.push(...page.items);
+      cursor = page.next_cursor;
+    } while (cursor);
+    return tasks;
+  },
+
+  async searchTasks(q: string, cursor?: string | null, limit?: number): Promise<TaskPage> {
+    const response = await api.get<TaskPage>('/api/tasks/search', {
+      params: { q, cursor: cursor ?? undefined, limit },
+    });
+    return response.data;
+  },
+
+  async getChanges(since?: string | null, limit?: number): Promise<TaskChanges> {
+    const response = await api.get<TaskChanges>('/api/tasks/changes', {
+      params: { since: since ?? undefined, limit },
+    });
     return response.data;
   },
 
@@ -29,4 +67,15 @@ export const taskApi = {
   async deleteTask(id: string): Promise<void> {
     await api.delete(`/api/tasks/${id}`);
   },
+
+  async batchOperations(operations: TaskBatchOperation[]): Promise<TaskBatchOperationResult[]> {
+    const response = await api.post<TaskBatchOperationResult[]>('/api/tasks/batch-ops', operations);
+    return response.data;
+  },
+
+  subscribeToEvents(onEvent: (event: TaskEvent) => void): () => void {
+    const source = new EventSource(`${API_URL}/api/tasks/events`);
+    source.onmessage = (message) => onEvent(JSON.parse(message.data));
+    return () => source.close();
+  },
 };
@@ -8,6 +8,11 @@ export interface Task {
   updated_at: string;
 }
 
+export interface TaskPage {
+  items: Task[];
+  next_cursor: string | null;
+}
+
 export interface CreateTaskInput {
   title: string;
   description?: string;
@@ -20,3 +25,26 @@ export interface UpdateTaskInput {
   category?: 'work' | 'personal' | 'urgent';
   estimated_time?: number | null;
 }
+
+export type TaskBatchOperation =
+  | ({ op: 'update'; id: string } & UpdateTaskInput)
+  | { op: 'delete'; id: string };
+
+export interface TaskBatchOperationResult {
+  id: string;
+  op: 'update' | 'delete';
+  status: 'updated' | 'deleted' | 'not_found';
+  task: Task | null;
+}
+
+export interface TaskEvent {
+  type: 'created' | 'updated' | 'deleted' | 'resync';
+  ids?: string[];
+}
+
+export interface TaskChanges {
+  tasks: Task[];
+  deleted: string[];
+  next_token: string;
+  has_more: boolean;
+}